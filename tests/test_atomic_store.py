@@ -0,0 +1,82 @@
+# tests/test_atomic_store.py
+
+import math
+import pathlib
+import sys
+
+# Ensure the repo root (containing the inner weall_node package dir) is on sys.path.
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from weall_node.weall_runtime.atomic_store import AtomicLedgerStore
+
+
+def test_save_then_load_roundtrip(tmp_path):
+    store = AtomicLedgerStore(tmp_path, keep_backups=2)
+    state = {"chain": [{"height": 0}], "balances": {"@alice": 1.5}}
+
+    store.save(state)
+
+    assert store.load() == state
+    # Journal marker is cleared after a successful commit.
+    assert not store.journal_path.exists()
+    # No stray temp files are left behind in the data dir.
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_load_falls_back_to_backup_when_primary_is_corrupt(tmp_path):
+    store = AtomicLedgerStore(tmp_path, keep_backups=2)
+    store.save({"v": 1})
+    store.save({"v": 2})
+
+    store.path.write_bytes(b"{not json")
+
+    assert store.load() == {"v": 1}
+
+
+def test_roundtrip_without_orjson(tmp_path, monkeypatch):
+    # orjson is an optional speedup; the stdlib path must stay equivalent.
+    from weall_node.weall_runtime import atomic_store
+
+    monkeypatch.setattr(atomic_store, "orjson", None)
+    store = AtomicLedgerStore(tmp_path)
+    state = {"b": [1, 2.5, None], "a": {"nested": "ü"}}
+
+    store.save(state)
+
+    assert store.path.read_bytes() == b'{"a":{"nested":"\xc3\xbc"},"b":[1,2.5,null]}'
+    assert store.load() == state
+
+
+def test_unchanged_save_does_not_rotate_backups(tmp_path):
+    store = AtomicLedgerStore(tmp_path, keep_backups=2)
+    store.save({"v": 1})
+    store.save({"v": 2})
+    bak1 = store.path.with_suffix(store.path.suffix + ".bak1")
+
+    store.save({"v": 2})
+    store.save({"v": 2})
+
+    assert store.load() == {"v": 2}
+    # The real previous state is still the newest backup.
+    assert bak1.read_bytes() == b'{"v":1}'
+
+
+def test_non_finite_floats_survive_a_roundtrip(tmp_path):
+    store = AtomicLedgerStore(tmp_path)
+    store.save({"x": float("nan"), "y": float("inf")})
+
+    loaded = store.load()
+    assert math.isnan(loaded["x"])
+    assert loaded["y"] == float("inf")
+
+
+def test_unchanged_save_rewrites_a_damaged_primary(tmp_path):
+    store = AtomicLedgerStore(tmp_path, keep_backups=2)
+    store.save({"v": 2})
+
+    store.path.write_bytes(b"{trunc")
+    store.save({"v": 2})
+
+    assert store.path.read_bytes() == b'{"v":2}'
@@ -0,0 +1,33 @@
+# tests/test_block_rejections.py
+
+import pathlib
+import sys
+
+# Ensure the repo root (containing the inner weall_node package dir) is on sys.path.
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from weall_node.core import poh_gate
+
+
+def test_rejections_are_counted_by_category():
+    before = poh_gate.get_rejection_stats()
+
+    for i in range(5):
+        poh_gate.log_block_rejection({"height": i}, f"height_mismatch:{i}!=0")
+    poh_gate.log_block_rejection({}, "apply_failed:some peer-controlled text")
+    poh_gate.log_block_rejection({}, "made_up_reason")
+
+    after = poh_gate.get_rejection_stats()
+    by_reason = after["rejections_by_reason"]
+    assert after["rejections_total"] - before["rejections_total"] == 7
+    assert set(by_reason) <= poh_gate.REJECTION_REASONS | {"other"}
+    assert by_reason["height_mismatch"] - before["rejections_by_reason"].get("height_mismatch", 0) == 5
+
+
+def test_sync_api_imports():
+    from weall_node.api import sync
+
+    assert sync.MIN_TIER == 3
+    assert not sync._apply_block_from_network({"height": 0})
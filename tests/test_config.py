@@ -0,0 +1,85 @@
+# tests/test_config.py
+
+import copy
+import os
+import pathlib
+import sys
+
+# Ensure the repo root (containing the inner weall_node package dir) is on sys.path.
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from weall_node import config
+
+
+def test_env_overrides_do_not_leak_into_defaults(tmp_path, monkeypatch):
+    before = copy.deepcopy(config._DEFAULT)
+    monkeypatch.setenv("SECRET_KEY", "test-secret")
+    monkeypatch.setenv("JWT_EXPIRE_MIN", "5")
+
+    cfg = config.load_config(str(tmp_path))
+
+    assert cfg["security"]["secret_key"] == "test-secret"
+    assert cfg["security"]["jwt_expire_min"] == 5
+    assert config._DEFAULT == before
+
+
+def test_yaml_overlay_is_reparsed_after_edit(tmp_path):
+    path = tmp_path / "weall_config.yaml"
+    path.write_text("server:\n  port: 9000\ncors:\n  origins: http://a.example\n")
+
+    cfg = config.load_config(str(tmp_path))
+    assert cfg["server"]["port"] == 9000
+    assert cfg["server"]["host"] == config._DEFAULT["server"]["host"]
+    assert cfg["cors"]["origins"] == ["http://a.example"]
+
+    path.write_text("server:\n  port: 9001\n")
+    # Make the edit visible even on filesystems with coarse mtimes.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+    assert config.load_config(str(tmp_path))["server"]["port"] == 9001
+
+
+def test_sidecar_ignored_when_older_yaml_is_restored(tmp_path):
+    path = tmp_path / "weall_config.yaml"
+    path.write_text("server:\n  port: 9000\n")
+    old = path.stat().st_mtime_ns
+    assert config.load_config(str(tmp_path))["server"]["port"] == 9000
+
+    path.write_text("server:\n  port: 9001\n")
+    os.utime(path, ns=(old + 10_000_000, old + 10_000_000))
+    assert config.load_config(str(tmp_path))["server"]["port"] == 9001
+
+    # Restore the first file with its original (older) mtime, as cp -p would.
+    path.write_text("server:\n  port: 9000\n")
+    os.utime(path, ns=(old, old))
+    config._parse_yaml.cache_clear()
+    assert config.load_config(str(tmp_path))["server"]["port"] == 9000
+
+
+def test_returned_config_does_not_share_nested_state(tmp_path):
+    before = copy.deepcopy(config._DEFAULT)
+    cfg = config.load_config(str(tmp_path))
+    cfg["cors"]["origins"].append("http://evil.example")
+    cfg["runtime"]["editable_roots"].clear()
+
+    assert config.load_config(str(tmp_path)) == before
+    assert config._DEFAULT == before
+
+    path = tmp_path / "weall_config.yaml"
+    path.write_text("cors:\n  origins: [http://a.example]\n")
+    config.load_config(str(tmp_path))["cors"]["origins"].append("http://b.example")
+    assert config.load_config(str(tmp_path))["cors"]["origins"] == ["http://a.example"]
+
+
+def test_sidecar_not_written_for_lossy_json(tmp_path):
+    path = tmp_path / "weall_config.yaml"
+    path.write_text("extra:\n  1: one\n")
+
+    assert config.load_config(str(tmp_path))["extra"] == {1: "one"}
+    assert not (tmp_path / "weall_config.yaml.json").exists()
+
+    config._parse_yaml.cache_clear()
+    assert config.load_config(str(tmp_path))["extra"] == {1: "one"}
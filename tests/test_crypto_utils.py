@@ -0,0 +1,143 @@
+# tests/test_crypto_utils.py
+
+import pathlib
+import sys
+
+import pytest
+
+# Ensure the repo root (containing the inner weall_node package dir) is on sys.path.
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from weall_node import crypto_utils
+
+
+def test_messaging_roundtrip_with_aad():
+    blob = crypto_utils.encrypt_message("hello", aad={"channel": "c1"})
+    assert crypto_utils.decrypt_message(blob) == "hello"
+
+
+def test_messaging_key_follows_secret_rotation(monkeypatch):
+    def rotate(secret):
+        monkeypatch.setattr(crypto_utils, "_server_secret", lambda: secret)
+        crypto_utils._invalidate_server_secret()
+
+    rotate("secret-a")
+    blob = crypto_utils.encrypt_message("hello")
+
+    rotate("secret-b")
+    with pytest.raises(Exception):
+        crypto_utils.decrypt_message(blob)
+
+    rotate("secret-a")
+    assert crypto_utils.decrypt_message(blob) == "hello"
+    monkeypatch.undo()
+    crypto_utils._invalidate_server_secret()
+
+
+def test_messaging_blobs_are_portable_across_aead_backends(monkeypatch):
+    if not crypto_utils._sodium_aesgcm_available():
+        pytest.skip("libsodium AES-GCM not usable on this host")
+
+    monkeypatch.setenv("WEALL_AEAD_BACKEND", "sodium")
+    crypto_utils._invalidate_messaging_key()
+    blob = crypto_utils.encrypt_message("hello", aad={"k": "v"})
+
+    monkeypatch.setenv("WEALL_AEAD_BACKEND", "cryptography")
+    crypto_utils._invalidate_messaging_key()
+    assert crypto_utils.decrypt_message(blob) == "hello"
+    crypto_utils._invalidate_messaging_key()
+
+
+def test_ed25519_verify_reuses_parsed_keys():
+    if not crypto_utils.NACL_AVAILABLE:
+        pytest.skip("PyNaCl not installed")
+
+    sk, pk = crypto_utils.ed25519_generate_keypair()
+    sig = crypto_utils.ed25519_sign(sk, b"msg")
+    crypto_utils._vk_for.cache_clear()
+
+    assert crypto_utils.ed25519_verify(pk, b"msg", sig)
+    assert crypto_utils.ed25519_verify(pk, b"msg", sig)
+    assert not crypto_utils.ed25519_verify(pk, b"other", sig)
+    assert crypto_utils._vk_for.cache_info().hits == 2
+
+
+def test_argon2_backends_derive_identical_seeds(monkeypatch):
+    if crypto_utils._argon2_low_level is None or crypto_utils.Argon2id is None:
+        pytest.skip("needs both argon2-cffi and cryptography Argon2id")
+
+    salt = b"s" * 16
+    fast = crypto_utils.derive_auth_seed("A@x.io", "pw", salt=salt)
+    monkeypatch.setattr(crypto_utils, "_argon2_low_level", None)
+    assert crypto_utils.derive_auth_seed("a@x.io", "pw", salt=salt) == fast
+
+
+def test_messaging_aad_forms_are_equivalent():
+    a = crypto_utils.encrypt_message("x", aad={"channel": "c1", "n": 2})
+    b = crypto_utils.encrypt_message("x", aad_bytes=b'{"channel":"c1","n":2}')
+    c = crypto_utils.encrypt_message("x", aad={"nested": {"k": [1]}})
+    assert a["aad"] == b["aad"]
+    assert crypto_utils.decrypt_message(b) == "x"
+    assert crypto_utils.decrypt_message(c) == "x"
+
+
+def test_messaging_nonces_are_unique_and_rotate():
+    seq = crypto_utils._NonceSequence()
+    a, b = seq.next(), seq.next()
+    assert len(a) == 12 and a != b and a[:8] == b[:8]
+
+    seq._local.counter = seq._LIMIT
+    c = seq.next()
+    assert c[8:] == bytes(4) and c[:8] != a[:8]
+
+    seq._reset()
+    d = seq.next()
+    assert d[8:] == bytes(4) and d[:8] != c[:8]
+
+
+def test_messaging_raw_form_matches_blob_form():
+    nonce, ct, ad = crypto_utils.encrypt_message_raw("hi", aad={"c": 1})
+    assert crypto_utils.decrypt_message_raw(nonce, ct, ad) == "hi"
+
+    blob = {"nonce": crypto_utils._b64e(nonce), "ciphertext": crypto_utils._b64e(ct),
+            "aad": crypto_utils._b64e(ad)}
+    assert crypto_utils.decrypt_message(blob) == "hi"
+
+
+def test_kdf_v2_blobs_coexist_with_hkdf_blobs(monkeypatch):
+    crypto_utils._invalidate_messaging_key()
+    old = crypto_utils.encrypt_message("before")
+    assert "kdf" not in old
+
+    monkeypatch.setenv("WEALL_KDF_V2", "1")
+    crypto_utils._invalidate_messaging_key()
+    new = crypto_utils.encrypt_message("after")
+    assert new["kdf"] == "b2"
+    assert crypto_utils.decrypt_message(old) == "before"
+    assert crypto_utils.decrypt_message(new) == "after"
+
+    monkeypatch.delenv("WEALL_KDF_V2")
+    crypto_utils._invalidate_messaging_key()
+    assert crypto_utils.decrypt_message(new) == "after"
+
+
+def test_ed25519_verify_bytes_matches_hex_path():
+    if not crypto_utils.NACL_AVAILABLE:
+        pytest.skip("PyNaCl not installed")
+
+    sk, pk = crypto_utils.ed25519_generate_keypair()
+    sig = crypto_utils.ed25519_sign(sk, b"msg")
+
+    assert crypto_utils.ed25519_verify_bytes(bytes.fromhex(pk), b"msg", bytes.fromhex(sig))
+    assert not crypto_utils.ed25519_verify_bytes(bytes.fromhex(pk), b"x", bytes.fromhex(sig))
+    assert not crypto_utils.ed25519_verify_bytes(b"short", b"msg", bytes.fromhex(sig))
+    assert crypto_utils.ed25519_verify("0x" + pk.upper(), b"msg", sig)
+
+
+def test_messaging_aad_keeps_value_types():
+    one = crypto_utils.encrypt_message("x", aad={"n": 1})
+    true = crypto_utils.encrypt_message("x", aad={"n": True})
+    assert crypto_utils._b64d(one["aad"]) == b'{"n":1}'
+    assert crypto_utils._b64d(true["aad"]) == b'{"n":true}'
@@ -0,0 +1,30 @@
+# tests/test_genesis_params.py
+
+import json
+import pathlib
+import sys
+
+import pytest
+
+# Ensure the repo root (containing the inner weall_node package dir) is on sys.path.
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from weall_node.consensus import params
+
+
+def test_genesis_params_are_frozen_all_the_way_down(tmp_path):
+    path = tmp_path / "genesis.json"
+    path.write_text(json.dumps({"pool_split": {"treasury": 1.0}, "seeds": ["a"]}))
+
+    loaded = params.load_genesis_params(str(path))
+    with pytest.raises(TypeError):
+        loaded["pool_split"]["treasury"] = 0.0
+    assert loaded["seeds"] == ("a",)
+
+    defaults = params.load_genesis_params(str(tmp_path / "missing.json"))
+    with pytest.raises(TypeError):
+        defaults["pool_split"]["validators"] = 1.0
+    assert params.DEFAULT_GENESIS["pool_split"]["validators"] == 0.20
+    assert params.load_genesis_params(str(path))["pool_split"] == {"treasury": 1.0}
@@ -0,0 +1,41 @@
+# tests/test_governance_runtime.py
+
+import pathlib
+import sys
+
+# Ensure the repo root (containing the inner weall_node package dir) is on sys.path.
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from weall_node import governance
+
+
+def test_params_set_with_non_numeric_value_is_enacted(monkeypatch):
+    monkeypatch.setattr(governance, "GLOBAL_PARAMS", dict(governance.GLOBAL_PARAMS))
+    gov = governance.GovernanceRuntime()
+    quorum = governance.GLOBAL_PARAMS["quorum"]
+
+    prop = gov.propose("@a", "t", "d", "Params.set", {"threshold": "two-thirds"})
+    for i in range(quorum):
+        assert gov.vote(f"@v{i}", prop.id, "yes")["ok"]
+
+    assert prop.status == "enacted"
+    assert governance.GLOBAL_PARAMS["threshold"] == "two-thirds"
+
+    # later proposals still vote and enact
+    prop = gov.propose("@a", "t", "d", "Params.set", {"juror_reward": 7})
+    for i in range(quorum):
+        gov.vote(f"@v{i}", prop.id, "yes")
+    assert prop.status == "enacted"
+    assert governance.GLOBAL_PARAMS["juror_reward"] == 7
+
+
+def test_direct_quorum_write_applies_to_next_vote(monkeypatch):
+    monkeypatch.setitem(governance.GLOBAL_PARAMS, "quorum", 1)
+    gov = governance.GovernanceRuntime()
+
+    prop = gov.propose("@a", "t", "d", "Params.set", {})
+    gov.vote("@v", prop.id, "yes")
+
+    assert prop.status == "enacted"
@@ -0,0 +1,44 @@
+# tests/test_ipfs_client.py
+
+import pathlib
+import sys
+
+# Ensure the repo root (containing the inner weall_node package dir) is on sys.path.
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from weall_node.ipfs import client as ipfs_client
+
+
+class _FakeHTTP:
+    def __init__(self, addr):
+        self.calls = []
+
+    def cat(self, cid):
+        self.calls.append(cid)
+        return cid.encode() * 5
+
+
+def test_cat_cache_hits_and_evicts_by_bytes(monkeypatch):
+    monkeypatch.setattr(ipfs_client, "ipfshttpclient", None)
+    monkeypatch.setattr(ipfs_client, "_HTTPFallback", _FakeHTTP)
+    monkeypatch.setattr(ipfs_client, "_CAT_CACHE_BYTES", 40)
+    c = ipfs_client.IPFSClient()
+
+    assert c.cat("aa") == b"aa" * 5
+    assert c.cat("aa") == b"aa" * 5
+    assert c.client.calls == ["aa"]
+
+    c.cat("bb")
+    c.cat("aa")  # refresh "aa" so "bb" is the oldest entry
+    c.cat("cc")
+    c.cat("dd")  # 4 x 10 bytes fills the budget
+    c.cat("ee")  # evicts "bb"
+    assert c.cache_stats()["cat_bytes"] == 40
+
+    c.cat("aa")
+    c.cat("bb")
+    assert c.client.calls == ["aa", "bb", "cc", "dd", "ee", "bb"]
+
+    assert c.cat_many(["bb", "ee", "bb"]) == {"bb": b"bb" * 5, "ee": b"ee" * 5}
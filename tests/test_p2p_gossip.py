@@ -0,0 +1,47 @@
+# tests/test_p2p_gossip.py
+
+import pathlib
+import sys
+
+import httpx
+
+# Ensure the repo root (containing the inner weall_node package dir) is on sys.path.
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from weall_node.p2p import gossip
+
+
+def test_legacy_peer_retries_sync_after_ttl(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(gossip.time, "monotonic", lambda: clock[0])
+    upgraded = [False]
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        if request.url.path == "/p2p/sync" and not upgraded[0]:
+            return httpx.Response(404)
+        return httpx.Response(200, json={"ok": True, "peers": []})
+
+    loop = gossip.GossipLoop()
+    loop._client.close()
+    loop._client = httpx.Client(transport=httpx.MockTransport(handler))
+    try:
+        loop._contact_peer("http://old", None, hello_body=b"{}")
+        assert seen == ["/p2p/sync", "/p2p/announce", "/p2p/peers"]
+
+        upgraded[0] = True
+        seen.clear()
+        loop._contact_peer("http://old", None, hello_body=b"{}")
+        assert seen == ["/p2p/announce", "/p2p/peers"]
+
+        clock[0] += gossip.LEGACY_RETRY_SEC
+        seen.clear()
+        loop._contact_peer("http://old", None, hello_body=b"{}")
+        assert seen == ["/p2p/sync"]
+        assert "http://old" not in loop._legacy_peers
+    finally:
+        loop._pool.shutdown(wait=False)
+        loop._client.close()
@@ -0,0 +1,88 @@
+# tests/test_p2p_registry.py
+
+import pathlib
+import sys
+
+# Ensure the repo root (containing the inner weall_node package dir) is on sys.path.
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from weall_node.p2p import mesh
+
+
+def test_peer_saves_are_debounced_until_flush(tmp_path, monkeypatch):
+    writes = []
+    real_write = mesh._write_json_atomic
+
+    def counting_write(path, data, mode=0o644):
+        writes.append(len(data["peers"]))
+        real_write(path, data, mode)
+
+    monkeypatch.setattr(mesh, "_write_json_atomic", counting_write)
+    reg = mesh.PeerRegistry(str(tmp_path / "peers.json"))
+
+    for i in range(50):
+        reg.upsert_peer(f"n{i}", addr=f"http://n{i}")
+    assert writes == [1]
+
+    reg.flush()
+    assert writes == [1, 50]
+    reg.flush()
+    assert writes == [1, 50]
+
+    assert len(mesh.PeerRegistry(reg.path).snapshot()) == 50
+
+
+def test_upsert_peers_merges_in_one_write(tmp_path, monkeypatch):
+    writes = []
+    monkeypatch.setattr(mesh, "_write_json_atomic", lambda path, data, mode=0o644: writes.append(data))
+    reg = mesh.PeerRegistry(str(tmp_path / "peers.json"))
+    reg.upsert_peer("a", addr="http://a", meta={"x": 1})
+    writes.clear()
+    monkeypatch.setattr(mesh, "SAVE_INTERVAL_SEC", 0.0)
+
+    applied = reg.upsert_peers([
+        {"node_id": "a", "addr": "", "meta": {"y": 2}},
+        {"node_id": "b", "addr": "http://b"},
+        {"addr": "http://nobody"},
+    ])
+
+    assert applied == 2
+    assert len(writes) == 1
+    peers = reg.list_peers()
+    assert peers["a"].addr == "http://a" and peers["a"].meta == {"x": 1, "y": 2}
+    assert peers["b"].addr == "http://b"
+
+
+def test_ttl_prune_drops_only_stale_head(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(mesh.time, "time", lambda: clock[0])
+    reg = mesh.PeerRegistry(str(tmp_path / "peers.json"), ttl_sec=100)
+
+    reg.upsert_peer("a", addr="http://a")
+    clock[0] += 60
+    reg.upsert_peer("b", addr="http://b")
+    clock[0] += 30
+    reg.upsert_peer("a", addr="http://a")  # refreshed: now newer than b
+    clock[0] += 60
+
+    assert sorted(reg.list_peers()) == ["a", "b"]
+    clock[0] += 20
+    assert sorted(reg.list_peers()) == ["a"]
+
+    reg.flush()
+    assert list(mesh.PeerRegistry(reg.path, ttl_sec=100).list_peers()) == ["a"]
+
+
+def test_debounced_change_is_written_without_further_activity(tmp_path, monkeypatch):
+    monkeypatch.setattr(mesh, "SAVE_INTERVAL_SEC", 0.05)
+    reg = mesh.PeerRegistry(str(tmp_path / "peers.json"))
+
+    reg.upsert_peer("a", addr="http://a")
+    reg.upsert_peer("b", addr="http://b")  # inside the interval: deferred
+
+    timer = reg._flush_timer
+    assert timer is not None
+    timer.join(2.0)
+    assert sorted(mesh.PeerRegistry(reg.path).list_peers()) == ["a", "b"]
@@ -0,0 +1,28 @@
+# tests/test_reputation_runtime.py
+
+import pathlib
+import sys
+
+# Ensure the repo root (containing the inner weall_node package dir) is on sys.path.
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from weall_node.weall_runtime.reputation import ReputationRuntime
+
+
+def test_apply_deltas_matches_sequential_apply_delta():
+    updates = [("a", 0.7, "x"), ("b", -0.2, None), ("a", 0.7, "y"), ("a", -0.5, "z")]
+
+    one = ReputationRuntime({})
+    for user, delta, reason in updates:
+        one.apply_delta(user, delta, reason)
+
+    batch = ReputationRuntime({})
+    final = batch.apply_deltas(updates)
+
+    assert final == {"a": one.get("a"), "b": one.get("b")}
+    assert final["a"] == 0.5  # clamped at 1.0 before the -0.5
+    assert [e["result"] for e in batch.state["rep_events"]] == [
+        e["result"] for e in one.state["rep_events"]
+    ]
@@ -3,6 +3,7 @@
 import pathlib
 import sys
 import math
+import random
 
 import pytest
 
@@ -185,3 +186,61 @@ def test_never_mints_past_max_supply():
     # All winners should be None when base_reward == 0
     for pool, winner in winners.items():
         assert winner is None
+
+
+def test_pool_members_snapshot_tracks_membership_changes():
+    """
+    pool_members() returns a sorted tuple that follows add_member/remove_member
+    and direct edits of the membership set, and never creates entries for
+    unknown pools.
+    """
+    ledger = WeCoinLedger()
+
+    ledger.add_member("jurors", "@bob")
+    ledger.add_member("jurors", "@alice")
+    assert ledger.pool_members("jurors") == ("@alice", "@bob")
+
+    ledger.remove_member("jurors", "@bob")
+    assert ledger.pool_members("jurors") == ("@alice",)
+
+    ledger.pools["jurors"]["members"].discard("@alice")
+    ledger.pools["jurors"]["members"].add("@carol")
+    assert ledger.pool_members("jurors") == ("@carol",)
+
+    assert ledger.pool_members("no_such_pool") == ()
+    assert "no_such_pool" not in ledger.pools
+
+
+def test_bulk_credit_matches_sequential_credits_exactly():
+    ledger = WeCoinLedger()
+    ledger.balances["@alice"] = 1.0
+
+    total = ledger.bulk_credit(
+        [("@alice", 2.0), ("@bob", 3.0), ("@alice", 0.5), ("", 9.0), ("@carol", 0.0)]
+    )
+
+    assert _almost_equal(total, 5.5)
+    assert ledger.balances == {"@alice": 3.5, "@bob": 3.0}
+
+    rng = random.Random(1)
+    credits = [(rng.choice("abc"), rng.uniform(0.0, 50.0)) for _ in range(30)]
+    bulk, seq = WeCoinLedger(), WeCoinLedger()
+    for account_id in "abc":
+        bulk.balances[account_id] = seq.balances[account_id] = 1000.1
+    bulk.bulk_credit(credits)
+    for account_id, amount in credits:
+        seq._credit(account_id, amount)
+    assert bulk.balances == seq.balances
+
+
+def test_block_rewards_follow_pool_split_replacement():
+    led = WeCoinLedger()
+    led.distribute_block_rewards(block_height=0, epoch=0, blocks_per_epoch=10)
+
+    led.set_pool_split({"treasury": 1.0})
+    before = led.get_balance(TREASURY_ACCOUNT)
+    winners = led.distribute_block_rewards(block_height=1, epoch=0, blocks_per_epoch=10)
+    assert list(winners) == ["treasury"]
+    assert led.get_balance(TREASURY_ACCOUNT) - before == pytest.approx(
+        led._current_block_reward(1)
+    )
@@ -20,7 +20,9 @@ Encryption model (Genesis):
 from __future__ import annotations
 
 import secrets
+import threading
 import time
+from collections import defaultdict
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException
@@ -110,12 +112,79 @@ def _get_store() -> List[Dict[str, Any]]:
     return messages
 
 
+class _MessageIndex:
+    """
+    In-memory lookup tables over the ledger's message list: ids for
+    de-duplication and per-recipient / per-sender lists for the inbox and
+    sent views, so neither has to scan every stored message.
+
+    The ledger list stays the source of truth. The index follows it
+    incrementally while it only grows and rebuilds if the list is replaced
+    (e.g. state reload) or shrinks (compaction).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._src: Optional[List[Dict[str, Any]]] = None
+        self._seen = 0
+        self._ids: set = set()
+        self._by_recipient: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._by_sender: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+
+    def _sync(self, messages: List[Dict[str, Any]]) -> None:
+        if self._src is not messages or len(messages) < self._seen:
+            self._src = messages
+            self._seen = 0
+            self._ids = set()
+            self._by_recipient = defaultdict(list)
+            self._by_sender = defaultdict(list)
+        for m in messages[self._seen:]:
+            if isinstance(m, dict):
+                mid = m.get("id")
+                if isinstance(mid, str):
+                    self._ids.add(mid)
+                self._by_recipient[str(m.get("recipient"))].append(m)
+                self._by_sender[str(m.get("sender"))].append(m)
+        self._seen = len(messages)
+
+    def append_if_new(self, messages: List[Dict[str, Any]], raw: Dict[str, Any]) -> bool:
+        with self._lock:
+            self._sync(messages)
+            mid = raw.get("id")
+            if isinstance(mid, str):
+                if mid in self._ids:
+                    return False
+            # Only string ids are indexed; anything else (possibly
+            # unhashable, from pubsub) gets the plain equality scan.
+            elif any(isinstance(m, dict) and m.get("id") == mid for m in messages):
+                return False
+            messages.append(raw)
+            self._sync(messages)
+            return True
+
+    def for_recipient(self, messages: List[Dict[str, Any]], user_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._sync(messages)
+            return list(self._by_recipient.get(user_id, ()))
+
+    def for_sender(self, messages: List[Dict[str, Any]], user_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._sync(messages)
+            return list(self._by_sender.get(user_id, ()))
+
+
+_index = _MessageIndex()
+
+
 def _save_store() -> None:
     """
     Best-effort persistence of the ledger after mutations.
+
+    Goes through the executor's debounced flusher (mark_dirty), so a burst
+    of messages costs one snapshot write instead of one per message.
     """
     try:
-        executor.save_state()
+        executor.mark_dirty()
     except Exception:
         # Non-fatal in Genesis
         pass
@@ -151,14 +220,10 @@ def _ingest_message(raw: Dict[str, Any]) -> bool:
     if not msg_id:
         return False
 
-    messages = _get_store()
-
     # De-duplicate by id
-    for existing in messages:
-        if existing.get("id") == msg_id:
-            return False
+    if not _index.append_if_new(_get_store(), raw):
+        return False
 
-    messages.append(raw)
     _save_store()
     return True
 
@@ -262,9 +327,8 @@ def get_inbox(user_id: str):
 
     This is the endpoint currently called by the web client for the inbox view.
     """
-    messages = _get_store()
     filtered = [
-        _normalize_message(m) for m in messages if str(m.get("recipient")) == user_id
+        _normalize_message(m) for m in _index.for_recipient(_get_store(), user_id)
     ]
     filtered.sort(key=lambda m: m.created_at, reverse=True)
     return filtered
@@ -277,9 +341,8 @@ def get_sent(user_id: str):
 
     This is the endpoint currently called by the web client for the sent view.
     """
-    messages = _get_store()
     filtered = [
-        _normalize_message(m) for m in messages if str(m.get("sender")) == user_id
+        _normalize_message(m) for m in _index.for_sender(_get_store(), user_id)
     ]
     filtered.sort(key=lambda m: m.created_at, reverse=True)
     return filtered
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import json
 import os
 import random
 import time
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from weall_node.p2p.mesh import get_registry, get_identity
 from weall_node.p2p.caps import build_self_capabilities, supports_purpose
@@ -213,3 +215,22 @@ def announce(payload: Dict[str, Any]) -> Dict[str, Any]:
 
     reg.upsert_peer(node_id=node_id, addr=addr, meta=meta if isinstance(meta, dict) else {})
     return {"ok": True, "ts": int(time.time())}
+
+
+@router.post("/sync")
+def sync(payload: Dict[str, Any], request: Request) -> Any:
+    """
+    announce + peers in one round-trip: verifies and records the caller's
+    signed hello exactly like /announce, then returns the /peers snapshot.
+
+    Callers that send Accept: application/x-ndjson get the peers as one JSON
+    object per line instead, so they can merge while the body arrives.
+    """
+    announce(payload)
+    peers = get_registry().snapshot_scored()
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        return StreamingResponse(
+            (json.dumps(p, separators=(",", ":")) + "\n" for p in peers),
+            media_type="application/x-ndjson",
+        )
+    return {"ok": True, "peers": peers, "ts": int(time.time())}
@@ -19,15 +19,14 @@ from pydantic import BaseModel, Field
 
 from ..weall_executor import executor
 from ..p2p.sync_manager import SyncManager
-from ..core.poh_gate import (
-    MIN_TIER,
-    get_poh_tier,
-    log_block_rejection,
-    get_rejection_stats,
-)
+from ..core.poh_gate import log_block_rejection, get_rejection_stats
+from .verification import current_tier as get_poh_tier
 
 router = APIRouter(prefix="/sync", tags=["sync"])
 
+# Block proposers must be full (Tier-3) participants, same as validators.
+MIN_TIER = 3
+
 # Single shared SyncManager for the node
 sync_mgr = SyncManager(topic="weall-sync")
 
@@ -84,7 +83,7 @@ def _apply_block_from_network(block: Dict[str, Any]) -> bool:
 
     tier = get_poh_tier(proposer)
     if tier < MIN_TIER:
-        log_block_rejection(block, f"poh_tier_{tier}_insufficient")
+        log_block_rejection(block, f"poh_tier_insufficient:{tier}")
         print(f"[SYNC] Rejected block from {proposer}: PoH tier {tier} < {MIN_TIER}")
         return False
 
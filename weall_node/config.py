@@ -1,7 +1,9 @@
 # weall_node/config.py
+import copy
+import functools
+import json
 import os
-import yaml
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 # -------- Defaults (non-secret) --------
 _DEFAULT: Dict[str, Any] = {
@@ -74,24 +76,107 @@ def _apply_env_overrides(cfg: Dict[str, Any]) -> Dict[str, Any]:
     return cfg
 
 
+def _sidecar_path(path: str) -> str:
+    return path + ".json"
+
+
+def _read_sidecar(path: str, src: List[int]) -> Optional[Dict[str, Any]]:
+    """
+    Return the JSON sidecar for `path` if it was written from a YAML file
+    with exactly this [st_size, st_mtime_ns]. Comparing for equality (not
+    "newer than") keeps restored older configs (cp -p, tar, rsync -t) from
+    being served a stale parse.
+    """
+    sidecar = _sidecar_path(path)
+    try:
+        with open(sidecar, "rb") as f:
+            wrapped = json.loads(f.read())
+    except Exception:
+        return None
+    if not isinstance(wrapped, dict) or wrapped.get("src") != src:
+        return None
+    data = wrapped.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def _write_sidecar(path: str, src: List[int], data: Dict[str, Any]) -> None:
+    """
+    Best-effort: persist the parsed YAML as JSON next to the source file.
+
+    Skipped when JSON can't reproduce the parse exactly (e.g. non-string
+    keys, which JSON turns into strings), so a later process never sees a
+    different config from the one that wrote the sidecar.
+    """
+    sidecar = _sidecar_path(path)
+    tmp = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        encoded = json.dumps({"src": src, "data": data}, separators=(",", ":"))
+        if json.loads(encoded)["data"] != data:
+            return
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(encoded)
+        os.replace(tmp, sidecar)
+    except Exception:
+        # Read-only checkouts, non-JSON YAML values, etc. just skip the cache.
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file once per (path, mtime, size). `mtime_ns` and `size` are
+    only part of the cache key, so editing the file invalidates the memoized
+    result. Callers must treat the returned dict as read-only.
+
+    Across processes, the parse is cached in a `<file>.json` sidecar that
+    records the YAML's size and mtime, so PyYAML only runs after the config
+    file changes.
+    """
+    src = [size, mtime_ns]
+    cached = _read_sidecar(path, src)
+    if cached is not None:
+        return cached
+
+    import yaml  # PyYAML is slow to import; only pay for it when a file exists
+
+    with open(path, "r") as f:
+        data = yaml.safe_load(f) or {}
+    data = data if isinstance(data, dict) else {}
+    _write_sidecar(path, src, data)
+    return data
+
+
 def load_config(repo_root: str) -> Dict[str, Any]:
     """
     Loads the YAML config from repo_root/weall_config.yaml.
     Returns defaults if the file doesn't exist or can't be parsed.
     Also applies ENV overrides for certain keys & secrets.
+
+    The parsed YAML is memoized by path, mtime and size, so repeated calls only
+    re-read the file after it changes on disk.
     """
     path = os.path.join(repo_root, "weall_config.yaml")
     cfg = dict(_DEFAULT)
 
-    if os.path.exists(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None  # no config file: defaults only
+
+    if st is not None:
         try:
-            with open(path, "r") as f:
-                data = yaml.safe_load(f) or {}
+            data = _parse_yaml(path, st.st_mtime_ns, st.st_size)
             cfg = _deep_merge(cfg, data)
         except Exception:
             # fall back to defaults
             pass
 
+    # The merge shares sub-dicts/lists with _DEFAULT and the memoized YAML
+    # parse; callers own the returned config, so hand out a deep copy.
+    cfg = copy.deepcopy(cfg)
     cfg = _apply_env_overrides(cfg)
 
     # Ensure derived types / minimal normalization
@@ -21,8 +21,10 @@ provided either explicitly to `load_genesis_params(path=...)` or via the
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
+import functools
 import json
 import os
 import time
@@ -61,7 +63,9 @@ DEFAULT_GENESIS: Dict[str, Any] = {
     },
 }
 
-GENESIS_CACHE: Optional[Dict[str, Any]] = None
+GENESIS_CACHE: Optional[Mapping[str, Any]] = None
+# (resolved_path, mtime_ns) that produced GENESIS_CACHE; None path = defaults.
+_GENESIS_CACHE_KEY: Optional[Tuple[Optional[str], int]] = None
 
 
 # ---------------------------------------------------------------------------
@@ -69,13 +73,27 @@ GENESIS_CACHE: Optional[Dict[str, Any]] = None
 # ---------------------------------------------------------------------------
 
 
+def _mtime_ns(path: Optional[str]) -> int:
+    """Return the file's mtime in ns, or -1 if there is no readable file."""
+    if not path:
+        return -1
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+@functools.lru_cache(maxsize=8)
+def _load_from_disk_cached(path: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    # mtime_ns is only part of the cache key: a rewritten file misses the cache.
+    return _load_from_disk(path)
+
+
 def _load_from_disk(path: str) -> Optional[Dict[str, Any]]:
     """Best-effort JSON loader for genesis parameters."""
     if not path:
         return None
     try:
-        if not os.path.exists(path):
-            return None
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
         if not isinstance(data, dict):
@@ -90,7 +108,16 @@ def _load_from_disk(path: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def load_genesis_params(path: Optional[str] = None) -> Dict[str, Any]:
+def _freeze(value: Any) -> Any:
+    """Recursively copy dicts into MappingProxyType and lists into tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def load_genesis_params(path: Optional[str] = None) -> Mapping[str, Any]:
     """
     Load genesis parameters from JSON, merged over DEFAULT_GENESIS.
 
@@ -101,10 +128,13 @@ def load_genesis_params(path: Optional[str] = None) -> Dict[str, Any]:
         4. DEFAULT_GENESIS (in-memory defaults)
 
     Disk parameters, when present, overwrite DEFAULT_GENESIS.
+
+    The merged result is cached and reused until the resolved path or its
+    mtime changes. It is deep-frozen (nested dicts become MappingProxyType,
+    lists become tuples) so every caller can share it without defensive
+    copies; call dict(...) on each level you need to modify.
     """
-    global GENESIS_CACHE
-    if GENESIS_CACHE is not None:
-        return GENESIS_CACHE
+    global GENESIS_CACHE, _GENESIS_CACHE_KEY
 
     # Resolve the path that should be consulted (if any)
     resolved_path: Optional[str] = path
@@ -113,17 +143,21 @@ def load_genesis_params(path: Optional[str] = None) -> Dict[str, Any]:
         if env_path:
             resolved_path = env_path
         else:
-            candidate = os.path.join(os.getcwd(), "genesis_params.json")
-            if os.path.exists(candidate):
-                resolved_path = candidate
+            # A missing file simply stats as -1 below; no separate exists().
+            resolved_path = os.path.join(os.getcwd(), "genesis_params.json")
+
+    key = (resolved_path or None, _mtime_ns(resolved_path))
+    if GENESIS_CACHE is not None and key == _GENESIS_CACHE_KEY:
+        return GENESIS_CACHE
 
     disk_params: Optional[Dict[str, Any]] = None
-    if resolved_path:
-        disk_params = _load_from_disk(resolved_path)
+    if resolved_path and key[1] >= 0:
+        disk_params = _load_from_disk_cached(resolved_path, key[1])
 
     merged: Dict[str, Any] = dict(DEFAULT_GENESIS)
-    for key, value in (disk_params or {}).items():
-        merged[key] = value
+    for k, value in (disk_params or {}).items():
+        merged[k] = value
 
-    GENESIS_CACHE = merged
-    return merged
+    GENESIS_CACHE = _freeze(merged)
+    _GENESIS_CACHE_KEY = key
+    return GENESIS_CACHE
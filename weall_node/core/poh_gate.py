@@ -15,8 +15,23 @@ Notes:
 
 from __future__ import annotations
 
+import logging
+import threading
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Callable, Dict
+
 from fastapi import HTTPException, status
 
+log = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def _forbidden_detail(min_tier: int, tier: int, action: str) -> str:
+    # Tiers are 0..3 and actions are a handful of literals, so this table
+    # stays tiny and rejected calls skip the f-string formatting.
+    return f"Tier {min_tier}+ required for {action}. Your tier: {tier}."
+
 
 def require_poh(tier: int | None, min_tier: int, *, action: str = "action") -> None:
     """
@@ -32,26 +47,98 @@ def require_poh(tier: int | None, min_tier: int, *, action: str = "action") -> N
         Human-readable action name for error messages.
     """
     t = int(tier or 0)
-    if t < int(min_tier):
+    m = int(min_tier)
+    if t < m:
+        # A fresh exception per raise: re-raising a shared instance would
+        # keep growing its __traceback__ and leak __context__ across requests.
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Tier {min_tier}+ required for {action}. Your tier: {t}.",
+            detail=_forbidden_detail(m, t, action),
         )
 
 
 # Convenience wrappers (use these in endpoints for clarity)
 
-def require_view(tier: int | None) -> None:
-    require_poh(tier, 0, action="view")
+
+def _make_tier_gate(min_tier: int, action: str) -> Callable[[int | None], None]:
+    """
+    Build a require_poh specialized for one (min_tier, action) pair.
+
+    Every possible rejection message (one per tier below min_tier) is
+    formatted up front, so the hot path is an int compare and a tuple index.
+    """
+    details = tuple(_forbidden_detail(min_tier, t, action) for t in range(min_tier))
+
+    def gate(tier: int | None) -> None:
+        t = int(tier or 0)
+        if t < min_tier:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=details[t] if t >= 0 else _forbidden_detail(min_tier, t, action),
+            )
+
+    return gate
+
+
+require_view = _make_tier_gate(0, "view")
+require_like_comment = _make_tier_gate(1, "like/comment")
+require_vote_join_post = _make_tier_gate(2, "vote/join/post")
+require_everything_else = _make_tier_gate(3, "tier-3 actions")
 
 
-def require_like_comment(tier: int | None) -> None:
-    require_poh(tier, 1, action="like/comment")
+# ---------------------------------------------------------------------------
+# Block rejection accounting (used by the sync API)
+# ---------------------------------------------------------------------------
 
+# Reasons are counted by category (the part before ":"); details such as
+# heights or exception text come from peers and only go to the log.
+REJECTION_REASONS = frozenset({
+    "missing_proposer",
+    "poh_tier_insufficient",
+    "height_mismatch",
+    "prev_block_mismatch",
+    "non_genesis_with_empty_chain",
+    "apply_failed",
+})
 
-def require_vote_join_post(tier: int | None) -> None:
-    require_poh(tier, 2, action="vote/join/post")
+_REJECTION_BY_REASON: Counter = Counter()
+_REJECTION_TOTAL = 0
+_REJECTION_LOCK = threading.Lock()
 
 
-def require_everything_else(tier: int | None) -> None:
-    require_poh(tier, 3, action="tier-3 actions")
+def log_block_rejection(block: Dict[str, Any], reason: str) -> None:
+    """
+    Record that a network block was rejected.
+
+    `reason` is "<category>" or "<category>:<detail>"; only known
+    categories get their own counter, anything else counts as "other".
+    The warning (and its %r of the block summary) is only formatted when
+    WARNING is enabled.
+    """
+    global _REJECTION_TOTAL
+    reason = str(reason)
+    category = reason.partition(":")[0]
+    if category not in REJECTION_REASONS:
+        category = "other"
+    if log.isEnabledFor(logging.WARNING):
+        log.warning(
+            "rejected block reason=%s %r",
+            reason,
+            {
+                "height": block.get("height"),
+                "block_id": block.get("block_id"),
+                "proposer": block.get("proposer") or block.get("proposer_id"),
+            },
+        )
+    with _REJECTION_LOCK:
+        _REJECTION_BY_REASON[category] += 1
+        _REJECTION_TOTAL += 1
+
+
+def get_rejection_stats() -> Dict[str, Any]:
+    """Snapshot of rejection counters, suitable for status endpoints."""
+    with _REJECTION_LOCK:
+        return {
+            "rejections_total": _REJECTION_TOTAL,
+            "rejections_by_reason": dict(_REJECTION_BY_REASON),
+        }
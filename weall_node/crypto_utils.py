@@ -9,6 +9,9 @@ This module provides:
 - Ed25519 helpers (via PyNaCl when available)
 - Deterministic KDF helpers for auth and recovery
 - AES-GCM messaging helpers using a key derived from the server secret
+  (libsodium's AES-GCM when the CPU supports it, else cryptography's;
+  override with WEALL_AEAD_BACKEND=auto|sodium|cryptography; WEALL_KDF_V2=1
+  derives new messaging keys with BLAKE2b instead of HKDF)
 
 Notes
 -----
@@ -18,11 +21,12 @@ Notes
 """
 
 import base64
-import binascii
+import functools
 import hashlib
 import hmac
 import json
 import os
+import threading
 from typing import Any, Dict, Optional, Tuple
 
 # Settings is only used to locate a server-side secret for messaging crypto
@@ -51,13 +55,15 @@ except Exception:  # pragma: no cover - fallback when PyNaCl is missing
 
 def _hex_to_bytes(h: str) -> bytes:
     """Decode hex string to raw bytes, accepting optional 0x prefix."""
-    h = h.strip().lower().replace("0x", "")
-    return binascii.unhexlify(h.encode("ascii"))
+    h = h.strip()
+    if h[:2] in ("0x", "0X"):
+        h = h[2:]
+    return bytes.fromhex(h)
 
 
 def _bytes_to_hex(b: bytes) -> str:
     """Encode raw bytes to lowercase hex string."""
-    return binascii.hexlify(b).decode("ascii")
+    return bytes(b).hex()
 
 
 def ed25519_generate_keypair() -> Tuple[str, str]:
@@ -105,6 +111,53 @@ def ed25519_sign(secret_key_hex: str, message: bytes) -> str:
     return _bytes_to_hex(sig)
 
 
+_VERIFY_KEY_CACHE_SIZE = int(os.environ.get("WEALL_VERIFY_KEY_CACHE_SIZE", "4096"))
+
+
+@functools.lru_cache(maxsize=_VERIFY_KEY_CACHE_SIZE)
+def _vk_for(public_key_hex: str) -> Any:
+    """
+    Parsed VerifyKey for a hex public key, kept in a bounded LRU.
+
+    The same validator / account keys recur on every block and message, so
+    this skips the hex decode and point decompression on repeat verifies.
+    Invalid keys raise and are therefore never cached.
+    """
+    return VerifyKey(_hex_to_bytes(public_key_hex))
+
+
+@functools.lru_cache(maxsize=_VERIFY_KEY_CACHE_SIZE)
+def _vk_for_raw(public_key: bytes) -> Any:
+    """Same as _vk_for, for callers that hold the raw 32-byte key."""
+    return VerifyKey(public_key)
+
+
+def _verify_ed25519_raw(vk: Any, message: bytes, signature: bytes) -> bool:
+    try:
+        vk.verify(message, signature)
+        return True
+    except BadSignatureError:
+        return False
+    except Exception:
+        return False
+
+
+def ed25519_verify_bytes(public_key: bytes, message: bytes, signature: bytes) -> bool:
+    """
+    Verify an Ed25519 signature given raw key and signature bytes.
+
+    For callers that already hold bytes (binary wire formats, BLOB columns):
+    no hex round trip at all.
+    """
+    if not NACL_AVAILABLE:
+        return False
+    try:
+        vk = _vk_for_raw(bytes(public_key))
+    except Exception:
+        return False
+    return _verify_ed25519_raw(vk, message, bytes(signature))
+
+
 def ed25519_verify(public_key_hex: str, message: bytes, signature_hex: str) -> bool:
     """
     Verify an Ed25519 signature.
@@ -114,14 +167,11 @@ def ed25519_verify(public_key_hex: str, message: bytes, signature_hex: str) -> b
     if not NACL_AVAILABLE:
         return False
     try:
-        vk = VerifyKey(public_key_hex, encoder=HexEncoder)
+        vk = _vk_for(public_key_hex)
         sig = _hex_to_bytes(signature_hex)
-        vk.verify(message, sig)
-        return True
-    except BadSignatureError:
-        return False
     except Exception:
         return False
+    return _verify_ed25519_raw(vk, message, sig)
 
 
 # Backwards-compat helper kept for older code paths
@@ -131,6 +181,13 @@ def verify_signature_ed25519(
     return ed25519_verify(public_key_hex, message, signature_hex)
 
 
+@functools.lru_cache(maxsize=32)
+def _hmac_template(secret: bytes) -> "hmac.HMAC":
+    # Keyed but unused HMAC; .copy() skips re-deriving the ipad/opad state.
+    # Callers must copy, never update the template itself.
+    return hmac.new(secret, digestmod=hashlib.sha256)
+
+
 def verify_signature_hmac(secret: str, message: bytes, signature_hex: str) -> bool:
     """
     Legacy HMAC-SHA256 verification helper.
@@ -139,10 +196,9 @@ def verify_signature_hmac(secret: str, message: bytes, signature_hex: str) -> bo
     New code should prefer Ed25519.
     """
     try:
-        mac = hmac.new(
-            secret.encode("utf-8"), msg=message, digestmod=hashlib.sha256
-        ).hexdigest()
-        return hmac.compare_digest(mac, signature_hex.lower())
+        mac = _hmac_template(secret.encode("utf-8")).copy()
+        mac.update(message)
+        return hmac.compare_digest(mac.hexdigest(), signature_hex.lower())
     except Exception:
         return False
 
@@ -175,12 +231,27 @@ def verify_genesis_signature(message: bytes, signature_hex: str) -> bool:
 
 try:
     from cryptography.hazmat.primitives.kdf.argon2 import Argon2id  # type: ignore
-
-    ARGON2_AVAILABLE = True
 except Exception:  # pragma: no cover
     Argon2id = None  # type: ignore
-    ARGON2_AVAILABLE = False
 
+# argon2-cffi wraps the reference C implementation (SIMD G-function, one
+# thread per lane); preferred when installed, same output as `cryptography`.
+try:
+    from argon2 import low_level as _argon2_low_level  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    _argon2_low_level = None  # type: ignore
+
+ARGON2_AVAILABLE = _argon2_low_level is not None or Argon2id is not None
+
+# Argon2id cost parameters. `lanes` is part of the hash definition, so it is
+# fixed rather than tuned to the host's core count: a seed derived on a phone
+# must be reproducible on a server. Changing any of these invalidates every
+# stored auth / recovery seed.
+_ARGON2_ITERATIONS = 2
+_ARGON2_LANES = 2
+_ARGON2_MEMORY_KIB = 64 * 1024
+
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
@@ -197,15 +268,25 @@ def _argon2id_or_scrypt(
     Parameters are tuned for interactive auth / wallet derivation, not high
     volume batch jobs. You can adjust them later via a config layer if needed.
     """
-    if ARGON2_AVAILABLE:
+    if _argon2_low_level is not None:
+        return _argon2_low_level.hash_secret_raw(
+            secret,
+            salt,
+            time_cost=_ARGON2_ITERATIONS,
+            memory_cost=_ARGON2_MEMORY_KIB,
+            parallelism=_ARGON2_LANES,
+            hash_len=length,
+            type=_argon2_low_level.Type.ID,
+        )
+    if Argon2id is not None:
         # Values roughly aligned with cryptography docs for Argon2id usage. 0
         # iterations=2, lanes=2, memory_cost=64*1024 KiB (~64 MiB) by default.
         kdf = Argon2id(
             salt=salt,
             length=length,
-            iterations=2,
-            lanes=2,
-            memory_cost=64 * 1024,
+            iterations=_ARGON2_ITERATIONS,
+            lanes=_ARGON2_LANES,
+            memory_cost=_ARGON2_MEMORY_KIB,
             ad=None,
             secret=None,
         )
@@ -282,18 +363,180 @@ def _server_secret() -> str:
     return "dev"  # last resort (non-production)
 
 
+@functools.lru_cache(maxsize=1)
+def _server_secret_cached() -> str:
+    """
+    _server_secret() resolved once. The secret is static in steady state;
+    after rotating it at runtime call _invalidate_server_secret() (or
+    _invalidate_messaging_key(), which also drops the derived ciphers).
+    """
+    return _server_secret()
+
+
+def _invalidate_server_secret() -> None:
+    _server_secret_cached.cache_clear()
+
+
+# Messaging KDF identifiers, recorded in blobs as "kdf" (absent = HKDF).
+_KDF_HKDF = "hkdf"
+_KDF_BLAKE2B = "b2"
+
+
+@functools.lru_cache(maxsize=1)
+def _messaging_kdf() -> str:
+    """
+    KDF used for new messages. WEALL_KDF_V2=1 switches to a one-shot keyed
+    BLAKE2b; blobs carry their KDF, so existing HKDF blobs keep decrypting
+    after the switch (no re-encryption needed).
+    """
+    flag = os.getenv("WEALL_KDF_V2", "").strip().lower()
+    return _KDF_BLAKE2B if flag in ("1", "true", "yes", "on") else _KDF_HKDF
+
+
 def _derive_messaging_key() -> bytes:
     """
-    Derive a 256-bit AES-GCM key from the server secret using HKDF-SHA256.
+    Derive a 256-bit AES-GCM key from the server secret (HKDF-SHA256, or
+    BLAKE2b under WEALL_KDF_V2).
     """
-    secret = _server_secret().encode("utf-8")
+    return _derive_messaging_key_for(_server_secret_cached(), _messaging_kdf())
+
+
+def _derive_messaging_key_for(secret: str, kdf: str = _KDF_HKDF) -> bytes:
+    if kdf == _KDF_BLAKE2B:
+        return hashlib.blake2b(
+            secret.encode("utf-8"), digest_size=32, person=b"weall-messaging"
+        ).digest()
+    if kdf != _KDF_HKDF:
+        raise ValueError(f"unknown messaging kdf: {kdf!r}")
     hkdf = HKDF(
         algorithm=hashes.SHA256(),
         length=32,
         salt=None,
         info=b"weall-messaging",
     )
-    return hkdf.derive(secret)
+    return hkdf.derive(secret.encode("utf-8"))
+
+
+try:
+    import nacl.bindings as _nacl_bindings  # type: ignore
+    import nacl.exceptions as _nacl_bindings_errors  # type: ignore
+except Exception:  # pragma: no cover - PyNaCl missing
+    _nacl_bindings = None  # type: ignore
+    _nacl_bindings_errors = None  # type: ignore
+
+
+class _SodiumAESGCM:
+    """
+    AESGCM-compatible adapter over libsodium's crypto_aead_aes256gcm_*.
+
+    Wire format is identical (12-byte nonce, ciphertext || 16-byte tag), so
+    blobs round-trip across backends. libsodium's implementation is the
+    stitched AES-NI + CLMUL loop; it is only usable on CPUs with AES-NI.
+    """
+
+    def __init__(self, key: bytes) -> None:
+        self._key = bytes(key)
+
+    def encrypt(self, nonce: bytes, data: bytes, associated_data: Optional[bytes]) -> bytes:
+        return _nacl_bindings.crypto_aead_aes256gcm_encrypt(data, associated_data, nonce, self._key)
+
+    def decrypt(self, nonce: bytes, data: bytes, associated_data: Optional[bytes]) -> bytes:
+        try:
+            return _nacl_bindings.crypto_aead_aes256gcm_decrypt(data, associated_data, nonce, self._key)
+        except _nacl_bindings_errors.CryptoError as e:
+            # Same failure type callers already see from cryptography's AESGCM.
+            raise InvalidTag() from e
+
+
+def _sodium_aesgcm_available() -> bool:
+    if _nacl_bindings is None or not hasattr(_nacl_bindings, "crypto_aead_aes256gcm_encrypt"):
+        return False
+    probe = getattr(_nacl_bindings, "crypto_aead_aes256gcm_is_available", None)
+    if probe is not None:
+        return bool(probe())
+    # Older/newer PyNaCl builds without the probe: libsodium refuses to run
+    # AES-GCM without hardware support, so a trial encrypt is the check.
+    try:
+        _nacl_bindings.crypto_aead_aes256gcm_encrypt(b"", None, bytes(12), bytes(32))
+        return True
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _select_aead_backend() -> str:
+    """
+    Pick the AES-256-GCM implementation for messaging.
+
+    WEALL_AEAD_BACKEND=auto (default) prefers libsodium when it can run,
+    =sodium requires it (falls back with the same check), and
+    =cryptography forces the cryptography/OpenSSL AESGCM.
+    """
+    choice = os.getenv("WEALL_AEAD_BACKEND", "auto").strip().lower()
+    if choice in ("auto", "sodium", "libsodium") and _sodium_aesgcm_available():
+        return "sodium"
+    return "cryptography"
+
+
+@functools.lru_cache(maxsize=4)
+def _get_aesgcm(secret: str, kdf: str = _KDF_HKDF) -> Any:
+    """
+    AES-GCM cipher for the messaging key derived from `secret`, built once
+    per secret on the backend chosen by _select_aead_backend().
+
+    Keyed on the secret itself, so a rotated secret derives a fresh key while
+    the steady state skips both HKDF and AES key setup per message.
+    """
+    key = _derive_messaging_key_for(secret, kdf)
+    if _select_aead_backend() == "sodium":
+        return _SodiumAESGCM(key)
+    return AESGCM(key)
+
+
+class _NonceSequence:
+    """
+    96-bit AES-GCM nonces: 8-byte random prefix || 4-byte big-endian counter.
+
+    Each thread draws its own prefix on first use (and again after fork, so
+    a child never replays its parent's sequence) and rotates it before its
+    counter wraps, so the hot path takes no lock and makes no syscall. With
+    64-bit prefixes, sequences in different threads or processes sharing
+    the messaging key collide with negligible probability; within one
+    sequence nonces are unique by construction.
+    """
+
+    _LIMIT = 1 << 32
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._generation = 0
+
+    def _reset(self) -> None:
+        # Invalidates every thread's prefix (used in the child after fork).
+        self._generation += 1
+
+    def next(self) -> bytes:
+        st = self._local
+        if getattr(st, "generation", -1) != self._generation or st.counter >= self._LIMIT:
+            st.generation = self._generation
+            st.prefix = os.urandom(8)
+            st.counter = 0
+        n = st.counter
+        st.counter = n + 1
+        return st.prefix + n.to_bytes(4, "big")
+
+
+_MESSAGING_NONCES = _NonceSequence()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_MESSAGING_NONCES._reset)
+
+
+def _invalidate_messaging_key() -> None:
+    """Drop cached messaging ciphers (tests / explicit key rotation)."""
+    _invalidate_server_secret()
+    _get_aesgcm.cache_clear()
+    _select_aead_backend.cache_clear()
+    _messaging_kdf.cache_clear()
 
 
 def _b64e(b: bytes) -> str:
@@ -301,29 +544,73 @@ def _b64e(b: bytes) -> str:
 
 
 def _b64d(s: str) -> bytes:
-    return base64.b64decode(s.encode("ascii"))
+    # b64decode accepts ASCII str directly; no intermediate bytes needed.
+    return base64.b64decode(s)
 
 
-def encrypt_message(
-    plaintext: str, *, aad: Optional[Dict[str, Any]] = None
-) -> Dict[str, str]:
+def _encode_aad(aad: Dict[str, Any]) -> bytes:
+    return json.dumps(aad, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def encrypt_message_raw(
+    plaintext: str,
+    *,
+    aad: Optional[Dict[str, Any]] = None,
+    aad_bytes: Optional[bytes] = None,
+) -> Tuple[bytes, bytes, Optional[bytes]]:
     """
-    Encrypt a UTF-8 string with AES-GCM using a key derived from the server secret.
+    Bytes-level form of encrypt_message for internal callers that never
+    put the result in JSON.
 
-    Returns a JSON-safe dict with base64 fields (nonce, ciphertext, optional aad).
+    Returns (nonce, ciphertext, aad_bytes_or_None), keyed with the current
+    _messaging_kdf(); pass the same kdf to decrypt_message_raw.
     """
     if not isinstance(plaintext, str):
         raise TypeError("plaintext must be a str")
-    key = _derive_messaging_key()
-    aes = AESGCM(key)
-    nonce = os.urandom(12)
-    ad: Optional[bytes] = None
+    if aad is not None and aad_bytes is not None:
+        raise ValueError("pass either aad or aad_bytes, not both")
+    aes = _get_aesgcm(_server_secret_cached(), _messaging_kdf())
+    nonce = _MESSAGING_NONCES.next()
+    ad: Optional[bytes] = aad_bytes
     if aad is not None:
-        ad = json.dumps(aad, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        ad = _encode_aad(aad)
     ct = aes.encrypt(nonce, plaintext.encode("utf-8"), ad)
+    return nonce, ct, ad
+
+
+def decrypt_message_raw(
+    nonce: bytes,
+    ciphertext: bytes,
+    aad_bytes: Optional[bytes] = None,
+    *,
+    kdf: Optional[str] = None,
+) -> str:
+    """Inverse of encrypt_message_raw (kdf defaults to the current one)."""
+    aes = _get_aesgcm(_server_secret_cached(), kdf or _messaging_kdf())
+    return aes.decrypt(nonce, ciphertext, aad_bytes).decode("utf-8")
+
+
+def encrypt_message(
+    plaintext: str,
+    *,
+    aad: Optional[Dict[str, Any]] = None,
+    aad_bytes: Optional[bytes] = None,
+) -> Dict[str, str]:
+    """
+    Encrypt a UTF-8 string with AES-GCM using a key derived from the server secret.
+
+    `aad` is JSON-encoded; callers that reuse the same metadata across
+    messages and already hold the encoded form can pass `aad_bytes` instead.
+
+    Returns a JSON-safe dict with base64 fields (nonce, ciphertext, optional aad).
+    """
+    nonce, ct, ad = encrypt_message_raw(plaintext, aad=aad, aad_bytes=aad_bytes)
     out: Dict[str, str] = {"nonce": _b64e(nonce), "ciphertext": _b64e(ct)}
     if ad is not None:
         out["aad"] = _b64e(ad)
+    kdf = _messaging_kdf()
+    if kdf != _KDF_HKDF:
+        out["kdf"] = kdf
     return out
 
 
@@ -333,13 +620,13 @@ def decrypt_message(blob: Dict[str, str]) -> str:
     """
     if not isinstance(blob, dict):
         raise TypeError("blob must be a dict")
-    key = _derive_messaging_key()
-    aes = AESGCM(key)
-    nonce = _b64d(blob["nonce"])
-    ct = _b64d(blob["ciphertext"])
     ad = _b64d(blob["aad"]) if "aad" in blob else None
-    pt = aes.decrypt(nonce, ct, ad)
-    return pt.decode("utf-8")
+    return decrypt_message_raw(
+        _b64d(blob["nonce"]),
+        _b64d(blob["ciphertext"]),
+        ad,
+        kdf=blob.get("kdf", _KDF_HKDF),
+    )
 
 
 # --- End messaging crypto helpers ---
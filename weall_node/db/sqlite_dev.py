@@ -13,12 +13,27 @@ class DB:
         await cls._pool.commit()
 
     @classmethod
-    async def execute(cls, sql, *params):
+    async def execute(cls, sql, *params, commit=True):
+        # Commits by default so one-off writes are durable without a DB.commit()
+        # the caller may never make; tight write loops pass commit=False and
+        # call DB.commit() once, or use execute_many.
         await cls.init()
         cur = await cls._pool.execute(sql, params)
-        await cls._pool.commit()
+        if commit:
+            await cls._pool.commit()
         return cur.lastrowid
 
+    @classmethod
+    async def execute_many(cls, sql, seq_of_params):
+        await cls.init()
+        await cls._pool.executemany(sql, seq_of_params)
+        await cls._pool.commit()
+
+    @classmethod
+    async def commit(cls):
+        await cls.init()
+        await cls._pool.commit()
+
     @classmethod
     async def query_all(cls, sql, *params):
         await cls.init()
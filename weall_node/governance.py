@@ -5,11 +5,14 @@ GovernanceRuntime:
 - Voting with quorum/threshold (threshold currently unused in MVP)
 - Enactment hooks (Treasury.allocate, Params.set, Governance.set_rules)
 
-Executor injects/shared GLOBAL_PARAMS from its own constants.
+Executor injects/shared GLOBAL_PARAMS from its own constants. Voting reads
+it directly on every call, so direct writes take effect immediately.
 """
 
 import time
-from typing import Dict, Any
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Any, Iterable, Tuple
 
 # This dict is overwritten by the executor at construction time to keep
 # parameters in sync across the whole runtime.
@@ -30,9 +33,34 @@ GLOBAL_PARAMS: Dict[str, Any] = {
 }
 
 
+def _current_quorum() -> int:
+    # A Params.set proposal may store any value; never let a non-numeric
+    # quorum break voting.
+    try:
+        return int(GLOBAL_PARAMS.get("quorum", 3))
+    except (TypeError, ValueError):
+        return 3
+
+
+@dataclass(slots=True)
+class Proposal:
+    id: int
+    creator: str
+    title: str
+    description: str
+    pallet: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    votes: Dict[str, str] = field(default_factory=dict)
+    status: str = "open"
+    created_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
 class GovernanceRuntime:
     def __init__(self):
-        self.proposals: Dict[int, Dict[str, Any]] = {}
+        self.proposals: Dict[int, Proposal] = {}
         self.next_proposal_id: int = 1
         self.ledger = None  # attached by executor
 
@@ -44,60 +72,85 @@ class GovernanceRuntime:
     ):
         pid = self.next_proposal_id
         self.next_proposal_id += 1
-        prop = {
-            "id": pid,
-            "creator": creator,
-            "title": title,
-            "description": description,
-            "pallet": pallet_ref,
-            "params": dict(params or {}),
-            "votes": {},
-            "status": "open",
-            "created_at": time.time(),
-        }
+        prop = Proposal(
+            id=pid,
+            creator=creator,
+            title=title,
+            description=description,
+            pallet=pallet_ref,
+            params=dict(params or {}),
+            created_at=time.time(),
+        )
         self.proposals[pid] = prop
         return prop
 
     def vote(self, user_id: str, proposal_id: int, vote_option: str):
         prop = self.proposals.get(proposal_id)
-        if not prop or prop["status"] != "open":
+        if prop is None or prop.status != "open":
             return {"ok": False, "error": "proposal_closed_or_missing"}
 
-        if user_id in prop["votes"]:
+        votes = prop.votes
+        if user_id in votes:
             return {"ok": False, "error": "already_voted"}
 
-        prop["votes"][user_id] = vote_option
+        votes[user_id] = vote_option
 
         # Check quorum only (threshold reserved for later use)
-        if len(prop["votes"]) >= int(GLOBAL_PARAMS.get("quorum", 3)):
+        if len(votes) >= _current_quorum():
+            self._enact(prop)
+
+        return {"ok": True, "votes": votes, "status": prop.status}
+
+    def tally_batch(self, proposal_id: int, ballots: Iterable[Tuple[str, str]]):
+        """
+        Record many (user_id, vote_option) ballots at once, e.g. a vote replay
+        from sync. Replays of already-recorded voters (and repeats within the
+        batch) are skipped; quorum is checked once after the whole batch.
+        """
+        prop = self.proposals.get(proposal_id)
+        if prop is None or prop.status != "open":
+            return {"ok": False, "error": "proposal_closed_or_missing"}
+
+        votes = prop.votes
+        before = len(votes)
+        for user_id, vote_option in ballots:
+            votes.setdefault(user_id, vote_option)
+        accepted = len(votes) - before
+
+        if accepted and len(votes) >= _current_quorum():
             self._enact(prop)
 
-        return {"ok": True, "votes": prop["votes"], "status": prop["status"]}
+        return {
+            "ok": True,
+            "accepted": accepted,
+            "counts": dict(Counter(votes.values())),
+            "status": prop.status,
+        }
 
     # ------------------------
     # Enactment
     # ------------------------
-    def _enact(self, prop: Dict[str, Any]) -> None:
-        pallet = prop["pallet"]
-        params = prop.get("params", {})
+    def _enact(self, prop: Proposal) -> None:
+        pallet = prop.pallet
+        params = prop.params
 
         if pallet == "Treasury.allocate":
             pool = params.get("pool")
             amt = float(params.get("amount", 0))
             if self.ledger is not None:
                 self.ledger.mint(pool, amt)
-            prop["status"] = "enacted"
+            prop.status = "enacted"
 
         elif pallet == "Params.set":
             GLOBAL_PARAMS.update(params)
-            prop["status"] = "enacted"
+            prop.status = "enacted"
 
         elif pallet == "Governance.set_rules":
             GLOBAL_PARAMS.update(params)
-            prop["status"] = "enacted"
+            prop.status = "enacted"
 
         else:
-            prop["status"] = "rejected: unknown_pallet"
+            prop.status = "rejected: unknown_pallet"
 
     # ------------------------
     # Wire dependencies
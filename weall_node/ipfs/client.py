@@ -2,15 +2,19 @@
 IPFS Client wrapper for WeAll Node
 - Tries ipfshttpclient first
 - Falls back to raw HTTP requests (compatible with Kubo 0.38+)
-- Provides: add(path), add_bytes(data), cat(cid), pin(cid), get_info(cid)
-- Global: set_client(...), get_client(), init_default_client()
+- Provides: add(path), add_many(paths), add_bytes(data), cat(cid), cat_many(cids), cat_stream(cid), pin(cid), get_info(cid)
+- Global: set_client(...), get_client(), init_default_client(), close_default_client()
 """
 
 from __future__ import annotations
 import os
 import json
 import time
-from typing import Optional
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Optional ipfshttpclient (may fail with VersionMismatch on newer Kubo)
 try:
@@ -19,10 +23,81 @@ except Exception:
     ipfshttpclient = None  # type: ignore
 
 import requests  # lightweight HTTP fallback
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Global singleton
 _client: "IPFSClient" | None = None
 
+# Kubo's /api/v0/add only accepts multipart/form-data, so we frame the
+# "file" parts ourselves instead of letting requests buffer it via files=.
+_BOUNDARY = "weall-" + uuid.uuid4().hex
+_MULTIPART_CT = f"multipart/form-data; boundary={_BOUNDARY}"
+_MULTIPART_TAIL = f"\r\n--{_BOUNDARY}--\r\n".encode("ascii")
+_STREAM_CHUNK = 1 << 20
+# add_bytes() payloads above this are sent as (head, data, tail) pieces
+# rather than joined into one copy.
+_JOIN_LIMIT = 1 << 20
+
+# CIDs are immutable, so cat() results never go stale; only the size is bounded.
+_CAT_CACHE_BYTES = int(os.getenv("IPFS_CAT_CACHE_BYTES", str(64 * 1024 * 1024)))
+# get_info() goes through files/stat, which can change (pins, MFS), so it expires.
+_INFO_TTL_SECONDS = 60.0
+
+
+def _multipart_head(filename: str) -> bytes:
+    name = filename.replace('"', "_").replace("\r", "_").replace("\n", "_")
+    return (
+        f"--{_BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{name}"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode("utf-8")
+
+
+class _SizedChunks:
+    """Pre-built body pieces sent back to back, with an upfront Content-Length."""
+
+    def __init__(self, *parts: bytes):
+        self.parts = parts
+
+    def __len__(self) -> int:
+        return sum(map(len, self.parts))
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self.parts)
+
+
+class _MultipartFiles:
+    """
+    Streaming multipart body for one or more files on disk, one "file" part each.
+
+    Sized (so requests sends Content-Length, not chunked) and re-iterable:
+    each pass re-opens the files, so a retried request replays the full body.
+    """
+
+    def __init__(self, paths: List[str]):
+        self.paths = list(paths)
+        # Parts after the first need the CRLF that closes the previous part.
+        self.heads = [
+            (b"\r\n" if i else b"") + _multipart_head(os.path.basename(p))
+            for i, p in enumerate(self.paths)
+        ]
+        self.size = sum(os.path.getsize(p) for p in self.paths)
+
+    def __len__(self) -> int:
+        return sum(map(len, self.heads)) + self.size + len(_MULTIPART_TAIL)
+
+    def __iter__(self) -> Iterator[bytes]:
+        for head, path in zip(self.heads, self.paths):
+            yield head
+            with open(path, "rb") as f:
+                while True:
+                    chunk = f.read(_STREAM_CHUNK)
+                    if not chunk:
+                        break
+                    yield chunk
+        yield _MULTIPART_TAIL
+
 
 class _HTTPFallback:
     """
@@ -42,32 +117,75 @@ class _HTTPFallback:
             api_addr = f"http://{api_addr}"
         self.base = api_addr.rstrip("/")
 
+        # One keep-alive session for every call: Kubo's API is hit many times
+        # per request (add, cat, pin, stat), so don't reconnect each time.
+        # Everything in /api/v0 is POST; the calls we make are content-addressed
+        # and safe to repeat, so transient gateway errors are retried.
+        self.session = requests.Session()
+        self.session.headers.update({"Connection": "keep-alive"})
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.1,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
         # Quick sanity ping
         self._get("/api/v0/version")
 
     # --- HTTP helpers ---
     def _get(self, path: str, **params):
-        r = requests.post(self.base + path, data=params, timeout=30)
+        r = self.session.post(self.base + path, data=params, timeout=30)
         r.raise_for_status()
         return r
 
-    def _post_files(self, path: str, files):
-        r = requests.post(self.base + path, files=files, timeout=60)
+    def _post_multipart(self, path: str, body, params=None):
+        r = self.session.post(
+            self.base + path,
+            params=params,
+            data=body,
+            headers={"Content-Type": _MULTIPART_CT},
+            timeout=60,
+        )
         r.raise_for_status()
         return r
 
+    def close(self) -> None:
+        self.session.close()
+
     # --- Operations ---
     def add(self, path: str):
-        # streaming add: name must be "file"
-        with open(path, "rb") as f:
-            r = self._post_files(
-                "/api/v0/add", files={"file": (os.path.basename(path), f)}
-            )
+        # streaming add: the file is read in chunks, never held in memory
+        r = self._post_multipart("/api/v0/add", _MultipartFiles([path]))
         data = r.json()
         return data.get("Hash")
 
+    def add_many(self, paths: List[str]) -> List[str]:
+        # One request for all files; Kubo answers with one JSON line per
+        # file, in upload order.
+        r = self._post_multipart(
+            "/api/v0/add",
+            _MultipartFiles(paths),
+            params={"wrap-with-directory": "false"},
+        )
+        hashes = [json.loads(line)["Hash"] for line in r.iter_lines() if line]
+        if len(hashes) != len(paths):
+            raise RuntimeError(f"ipfs add returned {len(hashes)} results for {len(paths)} files")
+        return hashes
+
     def add_bytes(self, data: bytes):
-        r = self._post_files("/api/v0/add", files={"file": ("blob", data)})
+        # framed by hand instead of requests' multipart encoder; cat/pin/stat
+        # stay plain form posts with no file part
+        parts = (_multipart_head("blob"), bytes(data), _MULTIPART_TAIL)
+        body = _SizedChunks(*parts) if len(data) > _JOIN_LIMIT else b"".join(parts)
+        r = self._post_multipart("/api/v0/add", body)
         data = r.json()
         return data.get("Hash")
 
@@ -75,6 +193,13 @@ class _HTTPFallback:
         r = self._get("/api/v0/cat", arg=cid)
         return r.content
 
+    def cat_stream(self, cid: str, chunk_size: int = 65536) -> Iterator[bytes]:
+        with self.session.post(
+            self.base + "/api/v0/cat", data={"arg": cid}, timeout=30, stream=True
+        ) as r:
+            r.raise_for_status()
+            yield from r.iter_content(chunk_size)
+
     def pin_add(self, cid: str):
         r = self._get("/api/v0/pin/add", arg=cid)
         return r.json()
@@ -96,6 +221,14 @@ class IPFSClient:
         self.mode = "http"
         self.client = None
 
+        self._cache_lock = threading.Lock()
+        self._cat_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cat_cache_budget = max(0, _CAT_CACHE_BYTES)
+        self._cat_cache_bytes = 0
+        self._cat_hits = 0
+        self._cat_misses = 0
+        self._info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
         # First try ipfshttpclient if available
         if ipfshttpclient is not None:
             try:
@@ -128,6 +261,14 @@ class IPFSClient:
         else:
             return self.client.add(path)  # HTTP
 
+    def add_many(self, paths: List[str]) -> List[str]:
+        """Add several files, returning their CIDs in the same order."""
+        if not paths:
+            return []
+        if self.mode == "py":
+            return [self.add(p) for p in paths]
+        return self.client.add_many(paths)  # HTTP
+
     def add_bytes(self, data: bytes):
         if self.mode == "py":
             return self.client.add_bytes(data)  # type: ignore[attr-defined]
@@ -135,10 +276,85 @@ class IPFSClient:
             return self.client.add_bytes(data)  # HTTP
 
     def cat(self, cid: str) -> bytes:
+        with self._cache_lock:
+            data = self._cat_cache.get(cid)
+            if data is not None:
+                self._cat_cache.move_to_end(cid)
+                self._cat_hits += 1
+                return data
+            self._cat_misses += 1
+
         if self.mode == "py":
-            return self.client.cat(cid)  # type: ignore[attr-defined]
+            data = self.client.cat(cid)  # type: ignore[attr-defined]
         else:
-            return self.client.cat(cid)  # HTTP
+            data = self.client.cat(cid)  # HTTP
+        self._cat_cache_put(cid, data)
+        return data
+
+    def cat_stream(self, cid: str, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Yield a CID's bytes in chunks without holding the whole blob, e.g. for
+        a StreamingResponse. A cached copy is served as-is; streamed reads are
+        not added to the cat() cache.
+        """
+        with self._cache_lock:
+            data = self._cat_cache.get(cid)
+        if data is not None:
+            yield data
+        elif self.mode == "py":
+            yield self.client.cat(cid)  # type: ignore[attr-defined]
+        else:
+            yield from self.client.cat_stream(cid, chunk_size)  # HTTP
+
+    def cat_to_file(self, cid: str, path: str, chunk_size: int = 65536) -> int:
+        """Write a CID to `path` chunk by chunk; returns the byte count."""
+        written = 0
+        with open(path, "wb") as f:
+            for chunk in self.cat_stream(cid, chunk_size):
+                f.write(chunk)
+                written += len(chunk)
+        return written
+
+    def _cat_cache_put(self, cid: str, data: bytes) -> None:
+        size = len(data)
+        # Large blobs would flush everything else out; leave them uncached.
+        if size > self._cat_cache_budget // 4:
+            return
+        with self._cache_lock:
+            if cid in self._cat_cache:
+                return
+            self._cat_cache[cid] = data
+            self._cat_cache_bytes += size
+            while self._cat_cache_bytes > self._cat_cache_budget:
+                _, old = self._cat_cache.popitem(last=False)
+                self._cat_cache_bytes -= len(old)
+
+    def cache_stats(self) -> Dict[str, int]:
+        with self._cache_lock:
+            return {
+                "cat_entries": len(self._cat_cache),
+                "cat_bytes": self._cat_cache_bytes,
+                "cat_budget": self._cat_cache_budget,
+                "cat_hits": self._cat_hits,
+                "cat_misses": self._cat_misses,
+                "info_entries": len(self._info_cache),
+            }
+
+    def cat_many(self, cids: Iterable[str], max_concurrency: int = 16) -> Dict[str, bytes]:
+        """
+        Fetch several CIDs, keyed by CID (duplicates fetched once).
+
+        The HTTP fallback's pooled session is thread-safe, so those requests
+        run concurrently and the wall time is roughly the slowest CID rather
+        than the sum. ipfshttpclient makes no such promise and stays serial.
+        Errors propagate as they would from cat().
+        """
+        unique = list(dict.fromkeys(cids))
+        workers = min(int(max_concurrency), len(unique))
+        if self.mode == "py" or workers <= 1:
+            return {cid: self.cat(cid) for cid in unique}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ipfs-cat") as pool:
+            return dict(zip(unique, pool.map(self.cat, unique)))
 
     def pin(self, cid: str):
         if self.mode == "py":
@@ -148,6 +364,19 @@ class IPFSClient:
             return self.client.pin_add(cid)  # HTTP
 
     def get_info(self, cid: str) -> dict:
+        now = time.monotonic()
+        cached = self._info_cache.get(cid)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        info = self._get_info_uncached(cid)
+        # Only successful lookups are remembered; errors retry next call.
+        if info.get("ok"):
+            if len(self._info_cache) >= 1024:
+                self._info_cache = {k: v for k, v in self._info_cache.items() if v[0] > now}
+            self._info_cache[cid] = (now + _INFO_TTL_SECONDS, info)
+        return info
+
+    def _get_info_uncached(self, cid: str) -> dict:
         try:
             if self.mode == "py":
                 # Some ipfshttpclient versions expose files.stat through commands
@@ -159,6 +388,14 @@ class IPFSClient:
         except Exception as e:
             return {"ok": False, "cid": cid, "error": str(e)}
 
+    def close(self) -> None:
+        close = getattr(self.client, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:
+                pass
+
 
 def set_client(client: IPFSClient | None):
     global _client
@@ -186,3 +423,11 @@ def init_default_client(force: bool = False) -> IPFSClient | None:
     except Exception:
         # leave None; callers can detect and fallback to local storage
         return None
+
+
+def close_default_client() -> None:
+    """Release the global client's pooled connections (app shutdown hook)."""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
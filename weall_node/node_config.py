@@ -41,13 +41,19 @@ Notes
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .weall_runtime import roles as runtime_roles
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional speedup, not installed on Termux
+    orjson = None  # type: ignore
+
 
 # Repo root = parent of the package directory (weall_node/)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -55,13 +61,18 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 # Default data dir (matches weall_node/settings.py)
 DATA_DIR = Path(os.getenv("WEALL_DATA_DIR", str(PROJECT_ROOT / "data")))
 
+# Config file locations, resolved once.
+_NODE_KIND_PATH = PROJECT_ROOT / "node_kind.json"
+_VALIDATORS_PATH = PROJECT_ROOT / "validators.json"
+_NODE_ID_PATH_PRIMARY = DATA_DIR / "node_id.json"
+_NODE_ID_PATH_LEGACY = PROJECT_ROOT / "node_id.json"
+
 
 def _read_json(path: Path) -> Optional[dict]:
     try:
-        if not path.exists():
-            return None
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        # A missing file raises here; no separate exists() stat.
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         return data if isinstance(data, dict) else None
     except Exception:
         return None
@@ -72,26 +83,22 @@ def _read_json(path: Path) -> Optional[dict]:
 # ---------------------------------------------------------------------------
 
 
+_KIND_BY_VALUE: Dict[str, runtime_roles.NodeKind] = {k.value: k for k in runtime_roles.NodeKind}
+
+
 def _from_env_node_kind() -> Optional[runtime_roles.NodeKind]:
     raw = os.getenv("WEALL_NODE_KIND")
     if not raw:
         return None
-    raw = raw.strip().lower()
-    for kind in runtime_roles.NodeKind:
-        if kind.value == raw:
-            return kind
-    return None
+    return _KIND_BY_VALUE.get(raw.strip().lower())
 
 
+@functools.lru_cache(maxsize=1)
 def _from_file_node_kind() -> Optional[runtime_roles.NodeKind]:
-    data = _read_json(PROJECT_ROOT / "node_kind.json")
+    data = _read_json(_NODE_KIND_PATH)
     if not data:
         return None
-    raw = str(data.get("node_kind", "")).strip().lower()
-    for kind in runtime_roles.NodeKind:
-        if kind.value == raw:
-            return kind
-    return None
+    return _KIND_BY_VALUE.get(str(data.get("node_kind", "")).strip().lower())
 
 
 def _resolve_node_kind() -> runtime_roles.NodeKind:
@@ -112,17 +119,16 @@ NODE_KIND: runtime_roles.NodeKind = _resolve_node_kind()
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
 def _read_node_id() -> Optional[str]:
     """Best-effort read of node_id.json.
 
     Preferred location is the runtime data dir (WEALL_DATA_DIR / node_id.json).
     For backward compatibility, we also try the legacy repo-root node_id.json.
     """
-    # Preferred (runtime-local) location
-    data = _read_json(DATA_DIR / "node_id.json")
-    if not data:
-        # Legacy fallback (do NOT ship secrets here)
-        data = _read_json(PROJECT_ROOT / "node_id.json")
+    # Preferred (runtime-local) location, then the legacy fallback
+    # (do NOT ship secrets there)
+    data = _read_json(_NODE_ID_PATH_PRIMARY) or _read_json(_NODE_ID_PATH_LEGACY)
     if not data:
         return None
     nid = str(data.get("node_id") or "").strip()
@@ -148,8 +154,9 @@ def _quorum_from_env() -> Optional[float]:
         return None
 
 
+@functools.lru_cache(maxsize=1)
 def _validators_from_file() -> tuple[Optional[List[str]], Optional[float]]:
-    data = _read_json(PROJECT_ROOT / "validators.json")
+    data = _read_json(_VALIDATORS_PATH)
     if not data:
         return None, None
     vals = data.get("validators")
@@ -172,23 +179,30 @@ _env_quorum = _quorum_from_env()
 _file_validators, _file_quorum = _validators_from_file()
 
 
-def _dedup(vals: List[str]) -> List[str]:
-    seen = set()
-    out = []
-    for v in vals:
-        if v not in seen:
-            out.append(v)
-            seen.add(v)
-    return out
+def _dedup(vals: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(vals))
 
 
-VALIDATORS: List[str] = _dedup(
+def _fallback_validators() -> List[str]:
+    nid = _read_node_id()
+    return [nid] if nid else []
+
+
+# Frozen: resolved once at import and shared read-only by the executor.
+VALIDATORS: Tuple[str, ...] = _dedup(
     _env_validators
     or _file_validators
-    or ([(_read_node_id() or "")] if _read_node_id() else [])
+    or _fallback_validators()
 )
 
 # Spec v2 default for voting quorum is 60%
 QUORUM_FRACTION: float = float(
     _env_quorum if _env_quorum is not None else (_file_quorum if _file_quorum is not None else 0.60)
 )
+
+
+def config_clear_cache() -> None:
+    """Forget cached file reads so the next call re-reads the JSON files (tests)."""
+    _from_file_node_kind.cache_clear()
+    _read_node_id.cache_clear()
+    _validators_from_file.cache_clear()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Tuple
 
 
 def _bool_env(name: str, default: bool = False) -> bool:
@@ -31,6 +32,16 @@ def _csv_env(name: str, default: List[str] | None = None) -> List[str]:
 
 
 def build_self_capabilities() -> Dict[str, Any]:
+    """
+    This node's capability dict, read from the environment once per process.
+    Callers get their own copy, so mutating it can't leak into the cache.
+    """
+    caps = _self_capabilities()
+    return {**caps, "supports": list(caps["supports"])}
+
+
+@lru_cache(maxsize=1)
+def _self_capabilities() -> Dict[str, Any]:
     """
     Capability schema is intentionally small and JSON-friendly.
     Stored under peer.meta["caps"].
@@ -86,4 +97,13 @@ def supports_purpose(peer_meta: Dict[str, Any], purpose: str) -> bool:
     if not isinstance(supp, list):
         return False
     purpose = (purpose or "").strip().lower()
-    return purpose in {str(x).strip().lower() for x in supp if x}
+    try:
+        return purpose in _normalized_supports(tuple(supp))
+    except TypeError:  # unhashable junk in a peer's list
+        return purpose in {str(x).strip().lower() for x in supp if x}
+
+
+@lru_cache(maxsize=256)
+def _normalized_supports(supp: Tuple[Any, ...]) -> FrozenSet[str]:
+    # Peers advertise a handful of distinct lists, so each is normalized once.
+    return frozenset(str(x).strip().lower() for x in supp if x)
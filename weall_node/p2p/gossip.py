@@ -16,11 +16,13 @@ Goals:
 
 from __future__ import annotations
 
+import json
 import logging
 import os
-import random
 import threading
 import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import httpx
@@ -30,6 +32,16 @@ from weall_node.p2p.caps import build_self_capabilities
 
 log = logging.getLogger(__name__)
 
+NDJSON = "application/x-ndjson"
+# Streamed peer records are merged in batches of this size.
+MERGE_BATCH = 64
+# How long a peer that answered 404/405 on /p2p/sync stays on the legacy
+# announce + peers path before /p2p/sync is tried again (it may upgrade).
+LEGACY_RETRY_SEC = 3600.0
+
+# Stand-in for a PeerRecord when all we have is a bootstrap address.
+_BootstrapPeer = namedtuple("_BootstrapPeer", "node_id addr")
+
 
 class GossipLoop:
     def __init__(self) -> None:
@@ -47,6 +59,21 @@ class GossipLoop:
         # Capabilities advertised in announce meta
         self.self_caps = build_self_capabilities()
 
+        # One keep-alive client for every peer contact, so repeat peers (and
+        # bootstrap nodes every tick) skip the TCP/TLS handshake.
+        self._client = httpx.Client(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
+        # addr -> monotonic time a peer was found to predate POST /p2p/sync;
+        # until LEGACY_RETRY_SEC later it gets announce + peers instead.
+        self._legacy_peers: dict = {}
+        # Peers are contacted concurrently so one slow peer can't stall a tick.
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(4, self.fanout + len(self.bootstrap)),
+            thread_name_prefix="p2p-gossip",
+        )
+
     def _parse_bootstrap(self) -> List[str]:
         raw = os.getenv("WEALL_P2P_BOOTSTRAP", "")
         return [p.strip().rstrip("/") for p in raw.split(",") if p.strip()]
@@ -58,61 +85,111 @@ class GossipLoop:
 
     def stop(self) -> None:
         self._stop.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._client.close()
+        get_registry().flush()
 
     def _run(self) -> None:
+        # With no peers and no bootstrap a tick does nothing, so idle ticks
+        # back off (doubling, capped at 4x the interval) until one has work.
+        delay = self.interval
         while not self._stop.is_set():
+            contacted = 1
             try:
-                self._tick()
+                contacted = self._tick()
             except Exception:
                 log.exception("[p2p] gossip tick failed")
-            self._stop.wait(self.interval)
+            delay = self.interval if contacted else min(delay * 2, self.interval * 4)
+            self._stop.wait(delay)
 
-    def _tick(self) -> None:
+    def _tick(self) -> int:
         reg = get_registry()
         ident = get_identity()
 
-        peers = list(reg.list_peers().values())
-        targets = []
-
-        if peers:
-            random.shuffle(peers)
-            targets.extend(peers[: self.fanout])
+        # Draw just the fanout, rather than shuffling the whole peer list.
+        targets = list(reg.sample_peers(self.fanout))
 
         # Always sprinkle in bootstrap peers
         for addr in self.bootstrap:
-            targets.append(type("Tmp", (), {"node_id": None, "addr": addr}))
+            targets.append(_BootstrapPeer(None, addr))
 
+        # Registry and bootstrap addresses are stored without a trailing "/".
         seen = set()
+        addrs = []
         for peer in targets:
-            addr = str(peer.addr).rstrip("/")
+            addr = peer.addr
             if not addr or addr in seen:
                 continue
             seen.add(addr)
-            self._contact_peer(addr, ident)
-
-        reg.prune_to_max(self.max_peers)
+            addrs.append(addr)
 
-    def _contact_peer(self, addr: str, ident) -> None:
-        url = addr.rstrip("/") + "/p2p"
-        try:
-            with httpx.Client(timeout=self.timeout) as client:
-                # announce (include capabilities)
-                meta = {"caps": self.self_caps}
-                announce_addr = self.self_addr or addr  # if self_addr not provided, keep "addr" field usable
-                hello = ident.signed_hello(announce_addr, meta=meta)
+        # With a fixed self address the hello is identical for every target,
+        # so sign and serialize it once per tick instead of once per peer.
+        hello_body = self._hello_body(ident, self.self_addr) if self.self_addr else None
 
-                r = client.post(url + "/announce", json=hello)
-                r.raise_for_status()
+        # _contact_peer swallows its own errors; wait for all before pruning.
+        list(self._pool.map(lambda a: self._contact_peer(a, ident, hello_body), addrs))
 
-                # fetch peers
-                r = client.get(url + "/peers")
-                r.raise_for_status()
-                data = r.json()
-                self._merge_peers(data)
+        reg.prune_to_max(self.max_peers)
+        reg.flush()
+        return len(addrs)
+
+    def _hello_body(self, ident, announce_addr: str) -> bytes:
+        # announce (include capabilities)
+        hello = ident.signed_hello(announce_addr, meta={"caps": self.self_caps})
+        return json.dumps(hello, separators=(",", ":")).encode("utf-8")
+
+    def _contact_peer(self, addr: str, ident, hello_body: bytes | None = None) -> None:
+        url = addr + "/p2p"
+        client = self._client
+        headers = {"content-type": "application/json"}
+        try:
+            if hello_body is None:
+                # if self_addr not provided, keep "addr" field usable
+                hello_body = self._hello_body(ident, addr)
+
+            # one round-trip: announce and fetch peers together, with the
+            # peer list streamed as NDJSON when the remote supports it
+            legacy_since = self._legacy_peers.get(addr)
+            if legacy_since is None or time.monotonic() - legacy_since >= LEGACY_RETRY_SEC:
+                with client.stream(
+                    "POST", url + "/sync", content=hello_body, headers={**headers, "accept": NDJSON}
+                ) as r:
+                    if r.status_code not in (404, 405):
+                        r.raise_for_status()
+                        if r.headers.get("content-type", "").startswith(NDJSON):
+                            self._merge_peer_lines(r.iter_lines())
+                        else:
+                            r.read()
+                            self._merge_peers(r.json())
+                        self._legacy_peers.pop(addr, None)
+                        return
+                self._legacy_peers[addr] = time.monotonic()
+
+            r = client.post(url + "/announce", content=hello_body, headers=headers)
+            r.raise_for_status()
+
+            # fetch peers
+            r = client.get(url + "/peers")
+            r.raise_for_status()
+            data = r.json()
+            self._merge_peers(data)
 
         except Exception as e:
             log.debug("[p2p] peer %s failed: %s", addr, e)
 
+    def _merge_peer_lines(self, lines) -> None:
+        batch = []
+        for line in lines:
+            if not line:
+                continue
+            batch.append(json.loads(line))
+            if len(batch) >= MERGE_BATCH:
+                self._merge_peers({"peers": batch})
+                batch = []
+        if batch:
+            self._merge_peers({"peers": batch})
+
     def _merge_peers(self, payload) -> None:
         if not isinstance(payload, dict):
             return
@@ -120,7 +197,7 @@ class GossipLoop:
         if not isinstance(peers, list):
             return
 
-        reg = get_registry()
+        records = []
         for rec in peers:
             if not isinstance(rec, dict):
                 continue
@@ -129,4 +206,8 @@ class GossipLoop:
             meta = rec.get("meta")
             if node_id and addr:
                 # Merge meta (including caps) if present
-                reg.upsert_peer(node_id=str(node_id), addr=str(addr), meta=meta if isinstance(meta, dict) else {})
+                records.append(
+                    {"node_id": str(node_id), "addr": str(addr), "meta": meta if isinstance(meta, dict) else {}}
+                )
+        if records:
+            get_registry().upsert_peers(records)
@@ -1,18 +1,56 @@
-import json, subprocess
+import json, os, subprocess, time
+
+import httpx
+
+# Health scrapes can poll this several times a second; the swarm size
+# doesn't need to be fresher than this.
+PEER_COUNT_TTL_SEC = 2.0
+
+_cache = {"t": float("-inf"), "v": 0}
+_client: httpx.Client | None = None
+
+
+def _count(peers) -> int:
+    # The CLI and the HTTP API both answer {"Peers": [...]} (null when empty).
+    if isinstance(peers, dict):
+        peers = peers.get("Peers")
+    return len(peers) if isinstance(peers, list) else 0
+
+
+def _peer_count_http() -> int:
+    global _client
+    if _client is None:
+        _client = httpx.Client(timeout=2.0)
+    base = os.getenv("IPFS_HTTP_API", "http://127.0.0.1:5001").rstrip("/")
+    r = _client.post(base + "/api/v0/swarm/peers")
+    r.raise_for_status()
+    return _count(r.json())
+
+
+def _peer_count_cli() -> int:
+    out = subprocess.check_output(
+        ["ipfs", "swarm", "peers", "--enc", "json"],
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    return _count(json.loads(out))
 
 
 def get_peer_count() -> int:
     """
     Return the current number of peers connected to the IPFS swarm.
-    Uses `ipfs swarm peers --enc json`.
+    Asks the daemon's HTTP API (no process spawn), falling back to
+    `ipfs swarm peers --enc json`; results are cached for PEER_COUNT_TTL_SEC.
     """
+    now = time.monotonic()
+    if now - _cache["t"] < PEER_COUNT_TTL_SEC:
+        return _cache["v"]
     try:
-        out = subprocess.check_output(
-            ["ipfs", "swarm", "peers", "--enc", "json"],
-            stderr=subprocess.DEVNULL,
-            text=True,
-        )
-        peers = json.loads(out)
-        return len(peers) if isinstance(peers, list) else 0
+        value = _peer_count_http()
     except Exception:
-        return 0
+        try:
+            value = _peer_count_cli()
+        except Exception:
+            value = 0
+    _cache["t"], _cache["v"] = now, value
+    return value
@@ -19,23 +19,58 @@ Higher-level APIs (sync, messaging, etc.) build on top of this.
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
+import random
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple, List
 
 from cryptography.hazmat.primitives.asymmetric import ed25519
 from cryptography.hazmat.primitives import serialization
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional speedup, not installed on Termux
+    orjson = None  # type: ignore
+
 log = logging.getLogger(__name__)
 
 NODE_ID_FILE = "node_id.json"
 PEERS_FILE = "peers.json"
 DEFAULT_TTL_SEC = 24 * 3600  # 1 day
 DEFAULT_MAX_PEERS = 500
+# Minimum spacing between peers.json rewrites; changes in between are
+# flushed by the next write, flush(), or at exit.
+SAVE_INTERVAL_SEC = 1.0
+
+
+def _write_json_atomic(path: str, data: Dict[str, Any], mode: int = 0o644) -> None:
+    """Write sorted, indented JSON to path via a temp file and os.replace."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=1024)
+def _public_key(pub_hex: str) -> ed25519.Ed25519PublicKey:
+    # Peers re-announce with the same key; parse each one once.
+    return ed25519.Ed25519PublicKey.from_public_bytes(bytes.fromhex(pub_hex))
 
 
 # ---------------------------------------------------------------------------
@@ -72,6 +107,8 @@ class NodeIdentity:
         self._pub_hex: Optional[str] = None
         self._node_id: Optional[str] = None
         self._load_or_create()
+        # Constant head of every hello message ("<node_id>|").
+        self._hello_prefix = (self.node_id + "|").encode("utf-8")
 
     # ----- public properties -------------------------------------------------
 
@@ -132,10 +169,8 @@ class NodeIdentity:
             "ed25519_priv": priv_bytes.hex(),
             "pub_hex": self._pub_hex,
         }
-        tmp_path = self.path + ".tmp"
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, sort_keys=True)
-        os.replace(tmp_path, self.path)
+        # Holds the private key: owner-only on a fresh file.
+        _write_json_atomic(self.path, data, mode=0o600)
 
     # ----- signing helpers ---------------------------------------------------
 
@@ -145,8 +180,7 @@ class NodeIdentity:
 
     def verify(self, message: bytes, signature_hex: str, pub_hex: Optional[str] = None) -> bool:
         try:
-            pub_hex = pub_hex or self.pub_hex
-            pub = ed25519.Ed25519PublicKey.from_public_bytes(bytes.fromhex(pub_hex))
+            pub = _public_key(pub_hex or self.pub_hex)
             pub.verify(bytes.fromhex(signature_hex), message)
             return True
         except Exception:
@@ -158,7 +192,8 @@ class NodeIdentity:
         ts = int(time.time())
         nonce = os.urandom(8).hex()
         meta = meta or {}
-        message = f"{self.node_id}|{addr}|{ts}|{nonce}".encode("utf-8")
+        # Same bytes as f"{node_id}|{addr}|{ts}|{nonce}", which /announce verifies.
+        message = b"|".join((self._hello_prefix + addr.encode("utf-8"), b"%d" % ts, nonce.encode("ascii")))
         signature = self.sign(message)
         return {
             "node_id": self.node_id,
@@ -207,8 +242,15 @@ class PeerRegistry:
         self.path = path
         self.ttl_sec = int(ttl_sec)
         self._lock = threading.Lock()
-        self._peers: Dict[str, PeerRecord] = {}
+        # Kept in last_seen order (oldest first): every refresh of last_seen
+        # moves the record to the end, so TTL pruning only looks at the head.
+        self._peers: "OrderedDict[str, PeerRecord]" = OrderedDict()
         self._local_meta: Dict[str, Any] = {}
+        self._dirty = False
+        self._last_save = 0.0
+        # Armed by a debounced change so it still reaches disk when nothing
+        # else writes afterwards (e.g. P2P disabled, announce-only nodes).
+        self._flush_timer: Optional[threading.Timer] = None
         self._load()
 
     def _load(self) -> None:
@@ -226,19 +268,22 @@ class PeerRegistry:
             peers = raw.get("peers")
             if not isinstance(peers, dict):
                 return
+            loaded = []
             for node_id, rec in peers.items():
                 if not isinstance(rec, dict):
                     continue
-                self._peers[str(node_id)] = PeerRecord(
+                loaded.append(PeerRecord(
                     node_id=str(node_id),
-                    addr=str(rec.get("addr") or ""),
+                    addr=str(rec.get("addr") or "").rstrip("/"),
                     last_seen=float(rec.get("last_seen") or 0.0),
                     meta=rec.get("meta") if isinstance(rec.get("meta"), dict) else {},
                     ok_count=int(rec.get("ok_count") or 0),
                     fail_count=int(rec.get("fail_count") or 0),
                     last_ok=float(rec.get("last_ok") or 0.0),
                     last_fail=float(rec.get("last_fail") or 0.0),
-                )
+                ))
+            loaded.sort(key=lambda r: r.last_seen)
+            self._peers = OrderedDict((r.node_id, r) for r in loaded)
         except Exception:
             log.warning("Failed to load peers cache", exc_info=True)
 
@@ -259,24 +304,61 @@ class PeerRegistry:
                     for node_id, rec in self._peers.items()
                 }
             }
-            tmp = self.path + ".tmp"
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, sort_keys=True)
-            os.replace(tmp, self.path)
+            _write_json_atomic(self.path, data)
+            self._dirty = False
+            self._last_save = time.monotonic()
         except Exception:
             log.warning("Failed to save peers cache", exc_info=True)
 
+    def _maybe_save_locked(self) -> None:
+        """
+        Record a change; write it now unless we wrote very recently, in
+        which case a deferred flush writes it once the interval has passed.
+        """
+        self._dirty = True
+        wait = SAVE_INTERVAL_SEC - (time.monotonic() - self._last_save)
+        if wait <= 0:
+            self._save()
+        elif self._flush_timer is None:
+            timer = threading.Timer(wait, self.flush)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+
+    def flush(self) -> None:
+        """Write any changes still pending from debounced saves."""
+        with self._lock:
+            timer, self._flush_timer = self._flush_timer, None
+            if timer is not None:
+                timer.cancel()
+            if self._dirty:
+                self._save()
+
     def _prune_locked(self) -> None:
-        now = time.time()
-        dead = [nid for nid, rec in self._peers.items() if now - rec.last_seen > self.ttl_sec]
-        for nid in dead:
-            self._peers.pop(nid, None)
+        cutoff = time.time() - self.ttl_sec
+        peers = self._peers
+        pruned = False
+        while peers:
+            rec = peers[next(iter(peers))]
+            if rec.last_seen >= cutoff:
+                break
+            peers.popitem(last=False)
+            pruned = True
+        if pruned:
+            self._dirty = True
 
     def list_peers(self) -> Dict[str, PeerRecord]:
         with self._lock:
             self._prune_locked()
             return dict(self._peers)
 
+    def sample_peers(self, k: int) -> List[PeerRecord]:
+        """Up to k distinct live peers, chosen uniformly at random."""
+        with self._lock:
+            self._prune_locked()
+            peers = list(self._peers.values())
+        return random.sample(peers, min(max(0, int(k)), len(peers)))
+
     # ------------------------------------------------------------------
     # Compatibility helpers (used by /api/p2p_overlay)
     # ------------------------------------------------------------------
@@ -315,8 +397,8 @@ class PeerRegistry:
                 reverse=True,
             )
             keep = {r.node_id for r in ranked[:max_peers]}
-            self._peers = {nid: rec for nid, rec in self._peers.items() if nid in keep}
-            self._save()
+            self._peers = OrderedDict((nid, rec) for nid, rec in self._peers.items() if nid in keep)
+            self._maybe_save_locked()
 
     def touch_local_meta(self, updates: Dict[str, Any]) -> None:
         """Merge updates into local_meta and persist."""
@@ -345,8 +427,9 @@ class PeerRegistry:
             rec.ok_count += 1
             rec.last_ok = time.time()
             rec.last_seen = time.time()
+            self._peers.move_to_end(node_id)
             self._prune_locked()
-            self._save()
+            self._maybe_save_locked()
 
     def mark_fail(self, node_id: str) -> None:
         if not node_id:
@@ -359,7 +442,7 @@ class PeerRegistry:
             rec.fail_count += 1
             rec.last_fail = time.time()
             self._prune_locked()
-            self._save()
+            self._maybe_save_locked()
 
     def touch_peer(self, node_id: str) -> None:
         if not node_id:
@@ -368,14 +451,16 @@ class PeerRegistry:
             rec = self._peers.get(node_id)
             if rec:
                 rec.last_seen = time.time()
+                self._peers.move_to_end(node_id)
             self._prune_locked()
-            self._save()
+            self._maybe_save_locked()
 
     def upsert_peer(self, node_id: str, addr: str = "", meta: Optional[Dict[str, Any]] = None) -> PeerRecord:
         if not node_id:
             raise ValueError("node_id is required")
         now = time.time()
         meta = meta or {}
+        addr = addr.rstrip("/")
         with self._lock:
             rec = self._peers.get(node_id)
             if rec is None:
@@ -385,10 +470,42 @@ class PeerRegistry:
                 rec.addr = addr or rec.addr
                 rec.last_seen = now
                 rec.meta.update(meta)
+                self._peers.move_to_end(node_id)
             self._prune_locked()
-            self._save()
+            self._maybe_save_locked()
             return rec
 
+    def upsert_peers(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Bulk upsert_peer for a gossip response: one lock, one prune, one save.
+
+        Each record needs node_id and addr; meta is optional. Records without
+        a node_id are skipped. Returns the number applied.
+        """
+        now = time.time()
+        applied = 0
+        with self._lock:
+            peers = self._peers
+            for r in records:
+                node_id = r.get("node_id")
+                if not node_id:
+                    continue
+                addr = (r.get("addr") or "").rstrip("/")
+                meta = r.get("meta") or {}
+                rec = peers.get(node_id)
+                if rec is None:
+                    peers[node_id] = PeerRecord(node_id=node_id, addr=addr, last_seen=now, meta=meta)
+                else:
+                    rec.addr = addr or rec.addr
+                    rec.last_seen = now
+                    rec.meta.update(meta)
+                    peers.move_to_end(node_id)
+                applied += 1
+            if applied:
+                self._prune_locked()
+                self._maybe_save_locked()
+        return applied
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -455,6 +572,7 @@ def init_p2p(repo_root: str) -> Tuple[PeerRegistry, NodeIdentity]:
     peers_path = os.path.join(data_dir, PEERS_FILE)
 
     _registry = PeerRegistry(peers_path)
+    atexit.register(_registry.flush)
     _identity = NodeIdentity(repo_root)
     log.info("[p2p] node_id=%s", _identity.node_id)
     return _registry, _identity
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from typing import Optional, Literal
+import asyncio
 import hashlib
+import sqlite3
 import time
 
 from fastapi import APIRouter, HTTPException, Response
@@ -151,8 +153,13 @@ async def register(body: RegisterReq, resp: Response):
     user_id = _derive_user_id(email)
     now = time.time()
 
-    pw_hash = hash_password(body.password)
-    auth_db.create_user(user_id=user_id, email=email, password_hash=pw_hash, now=now)
+    # Password hashing is deliberately slow; keep it off the event loop.
+    pw_hash = await asyncio.to_thread(hash_password, body.password)
+    try:
+        auth_db.create_user(user_id=user_id, email=email, password_hash=pw_hash, now=now)
+    except sqlite3.IntegrityError:
+        # A concurrent registration won while we were hashing.
+        raise HTTPException(status_code=409, detail="email already registered")
 
     # Store ban policy in ledger (spec §3.3 style)
     _store_ban_policy_in_ledger(user_id, body.ban_destination, (body.ban_group_id or None))
@@ -174,7 +181,7 @@ async def login(body: LoginReq, resp: Response):
     if not user:
         raise HTTPException(status_code=401, detail="invalid credentials")
 
-    if not verify_password(body.password, str(user["password_hash"])):
+    if not await asyncio.to_thread(verify_password, body.password, str(user["password_hash"])):
         raise HTTPException(status_code=401, detail="invalid credentials")
 
     now = time.time()
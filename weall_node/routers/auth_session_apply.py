@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import re
+import sqlite3
 import time
 from typing import Optional
 
@@ -62,16 +64,27 @@ async def auth_apply(payload: AuthApplyRequest, request: Request, response: Resp
         raise HTTPException(status_code=400, detail="missing_handle")
     user_id = _normalize_handle(handle)
 
+    # Password hashing / verification is deliberately slow (KDF work factor);
+    # run it in a worker thread so concurrent requests keep being served.
+    # Ledger and DB mutation stays on the loop thread.
     user = auth_db.get_user_by_id(user_id)
     if not user:
-        user = auth_db.create_user(
-            user_id=user_id,
-            email=payload.email,
-            password_hash=hasher.hash_password(payload.password),
-            now=now,
-        )
+        pw_hash = await asyncio.to_thread(hasher.hash_password, payload.password)
+        try:
+            user = auth_db.create_user(
+                user_id=user_id,
+                email=payload.email,
+                password_hash=pw_hash,
+                now=now,
+            )
+        except sqlite3.IntegrityError:
+            # A concurrent signup for the same handle won while we were hashing.
+            raise HTTPException(status_code=409, detail="handle_taken")
     else:
-        if not hasher.verify_password(payload.password, user.get("password_hash") or ""):
+        ok = await asyncio.to_thread(
+            hasher.verify_password, payload.password, user.get("password_hash") or ""
+        )
+        if not ok:
             raise HTTPException(status_code=401, detail="invalid_credentials")
         auth_db.update_user_login(user_id, now=now)
 
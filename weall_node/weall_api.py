@@ -1,18 +1,31 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
+import sys
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from weall_node.settings import settings
 from weall_node.p2p.mesh import init_p2p
-from weall_node.p2p.gossip import GossipLoop
 from weall_node.api import p2p_overlay
 
 log = logging.getLogger(__name__)
 
+# Constant liveness body, serialized once. A fresh Response wraps it per
+# request: middleware edits response headers in place, so they can't be shared.
+_HEALTH_BODY = json.dumps({"ok": True}, separators=(",", ":")).encode("utf-8")
+
+
+def _close_ipfs_client() -> None:
+    # Only if something actually loaded the IPFS client; importing it here
+    # would pull in requests just to close nothing.
+    ipfs_client = sys.modules.get("weall_node.ipfs.client")
+    if ipfs_client is not None:
+        ipfs_client.close_default_client()
+
 
 def create_app() -> FastAPI:
     app = FastAPI(title="WeAll Node API")
@@ -30,15 +43,21 @@ def create_app() -> FastAPI:
     init_p2p(repo_root)
 
     if settings.P2P_ENABLED:
+        # Imported here so nodes with P2P off never load gossip (and httpx).
+        from weall_node.p2p.gossip import GossipLoop
+
         gossip = GossipLoop()
         gossip.start()
 
+    # Drop pooled IPFS connections on shutdown
+    app.add_event_handler("shutdown", _close_ipfs_client)
+
     # Routers
     app.include_router(p2p_overlay.router)
 
     @app.get("/health")
     def health():
-        return {"ok": True}
+        return Response(content=_HEALTH_BODY, media_type="application/json")
 
     return app
 
@@ -9,6 +9,10 @@ Adds:
 - Genesis -> k-of-n transition hooks:
     - WEALL_GENESIS_SINGLE_VERIFIER=1: quorum=1 early
     - WEALL_KOFN_START_HEIGHT=N: switch to normal validator set/quorum after N blocks
+- Write-behind persistence for mempool/proposal churn:
+    - WEALL_FLUSH_INTERVAL_SECONDS (default 1.0; <=0 saves synchronously)
+    - WEALL_FLUSH_EVERY_N (default 100 deferred mutations forces a save)
+    - finalized blocks and explicit save_state() calls stay synchronous
 - Keeps previous:
     - strict prod mode
     - audit proofs (txs_root, receipts_root)
@@ -18,6 +22,7 @@ Adds:
 This is still single-process friendly, but the loop structure is “real node shaped”.
 """
 
+import atexit
 import hashlib
 import logging
 import os
@@ -123,17 +128,17 @@ class PBFTLite:
             self._votes.setdefault(proposal_id, set()).add(voter)
 
             q = self.quorum(force_one=force_one)
-            votes = self._votes.get(proposal_id, set())
+            votes = sorted(self._votes.get(proposal_id, ()))
             if len(votes) >= q and proposal_id not in self._finalized:
                 p = self._proposals[proposal_id]
                 self._finalized[proposal_id] = Finalized(
                     proposal_id=proposal_id,
                     proposer=str(p.get("proposer", "")),
-                    votes=sorted(list(votes)),
+                    votes=list(votes),
                     ts=_now(),
                 )
 
-            return {"ok": True, "proposal_id": proposal_id, "votes": sorted(list(votes)), "quorum": q}
+            return {"ok": True, "proposal_id": proposal_id, "votes": votes, "quorum": q}
 
     def finalized(self, proposal_id: str) -> Optional[Finalized]:
         with self._lock:
@@ -188,7 +193,11 @@ class WeAllExecutor:
 
         self._lock = threading.RLock()
 
-        self.cons = PBFTLite(validators=self._active_validators_for_height(0), quorum_fraction=float(QUORUM_FRACTION))
+        # VALIDATORS is resolved once at import, so the sorted set is too.
+        self._validators_cache: Optional[Tuple[str, ...]] = None
+        self._cons_members: Optional[Tuple[str, ...]] = None
+
+        self.cons = PBFTLite(validators=list(self._active_validators_for_height(0)), quorum_fraction=float(QUORUM_FRACTION))
         self.nonce_store = NonceStore(self.ledger.setdefault("nonces", {}))
 
         self.wecoin = None
@@ -197,6 +206,13 @@ class WeAllExecutor:
         self._stop_event = threading.Event()
         self._last_tick = 0.0
 
+        # Write-behind persistence (see mark_dirty)
+        self.flush_interval_s = float(os.environ.get("WEALL_FLUSH_INTERVAL_SECONDS", "1.0") or 0.0)
+        self.flush_every_n = max(1, int(os.environ.get("WEALL_FLUSH_EVERY_N", "100") or 100))
+        self._dirty_count = 0
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_stop = threading.Event()
+
         self._migrate_ledger()
         self._startup_recovery()
         self._startup_compaction_if_enabled()
@@ -212,21 +228,23 @@ class WeAllExecutor:
 
     # ----------------------- validator set + proposer rotation ------------------
 
-    def _all_validators(self) -> List[str]:
+    def _all_validators(self) -> Tuple[str, ...]:
+        cached = self._validators_cache
+        if cached is not None:
+            return cached
         vals = list(VALIDATORS) if VALIDATORS else [self.node_id]
         # deterministic order
-        vals = sorted({str(v) for v in vals if str(v).strip()})
-        if not vals:
-            vals = [self.node_id]
-        return vals
+        out = tuple(sorted({str(v) for v in vals if str(v).strip()})) or (self.node_id,)
+        self._validators_cache = out
+        return out
 
-    def _active_validators_for_height(self, height: int) -> List[str]:
+    def _active_validators_for_height(self, height: int) -> Tuple[str, ...]:
         """
         Genesis mode: optionally run with a single verifier early, then expand to full set.
         """
         height = int(height or 0)
         if self.genesis_single_verifier and height < self.kofn_start_height:
-            return [self.node_id]
+            return (self.node_id,)
         return self._all_validators()
 
     def _force_one_quorum_for_height(self, height: int) -> bool:
@@ -241,16 +259,23 @@ class WeAllExecutor:
         Round-robin proposer selection by *next* height.
         """
         h = self.chain_height()
-        vals = self._active_validators_for_height(h)
-        idx = h % max(1, len(vals))
-        return vals[idx]
+        return self._proposer_at(h, self._active_validators_for_height(h))
+
+    @staticmethod
+    def _proposer_at(height: int, vals: Tuple[str, ...]) -> str:
+        return vals[height % max(1, len(vals))]
 
     def _refresh_consensus_membership(self) -> None:
         """
         Keep PBFT-lite validator set aligned with the current phase.
         """
         h = self.chain_height()
-        self.cons.set_validators(self._active_validators_for_height(h))
+        members = self._active_validators_for_height(h)
+        # Membership only changes at the k-of-n switch; skip the set rebuild
+        # (and PBFT lock) on every other tick.
+        if members != self._cons_members:
+            self.cons.set_validators(list(members))
+            self._cons_members = members
 
     # ----------------------- ledger schema ------------------
 
@@ -336,6 +361,46 @@ class WeAllExecutor:
         with self._lock:
             safe = self._validate_ledger_for_save()
             self.store.save(safe)
+            self._dirty_count = 0
+
+    def flush(self) -> None:
+        """Persist now if there are deferred mutations."""
+        with self._lock:
+            if self._dirty_count:
+                self.save_state()
+
+    def mark_dirty(self) -> None:
+        """
+        Defer persistence for cheap-to-lose churn (mempool admission, block
+        proposals). A background flusher saves at most every
+        flush_interval_s; flush_every_n deferred mutations force a save, so
+        a crash loses a bounded window of unfinalized work.
+        """
+        with self._lock:
+            if self.flush_interval_s <= 0:
+                self.save_state()
+                return
+            self._dirty_count += 1
+            if self._dirty_count >= self.flush_every_n:
+                self.save_state()
+                return
+            self._start_flusher()
+
+    def _start_flusher(self) -> None:
+        if self._flush_thread and self._flush_thread.is_alive():
+            return
+        self._flush_stop.clear()
+        t = threading.Thread(target=self._flush_main, name="weall-state-flusher", daemon=True)
+        self._flush_thread = t
+        t.start()
+        atexit.register(self.flush)
+
+    def _flush_main(self) -> None:
+        while not self._flush_stop.wait(self.flush_interval_s):
+            try:
+                self.flush()
+            except Exception:
+                log.exception("deferred state flush failed")
 
     def _event(self, typ: str, data: dict) -> None:
         self.ledger.setdefault("events", []).append({"ts": _now(), "type": typ, "data": data})
@@ -528,16 +593,16 @@ class WeAllExecutor:
                 self.ledger["mempool"] = {"order": [], "by_id": {}}
                 mp = self.ledger["mempool"]
 
-            mp["order"] = _ensure_list(mp.get("order"))
-            mp["by_id"] = _ensure_dict(mp.get("by_id"))
+            order = mp["order"] = _ensure_list(mp.get("order"))
+            by_id = mp["by_id"] = _ensure_dict(mp.get("by_id"))
 
-            if tx_id_hex in mp["by_id"]:
+            if tx_id_hex in by_id:
                 return {"ok": True, "deduped": True, "tx_id": tx_id_hex}
 
-            mp["by_id"][tx_id_hex] = b64
-            mp["order"].append(tx_id_hex)
+            by_id[tx_id_hex] = b64
+            order.append(tx_id_hex)
 
-            self.save_state()
+            self.mark_dirty()
             return {"ok": True, "tx_id": tx_id_hex}
 
     def pop_mempool(self, limit: int = 100) -> List[dict]:
@@ -580,7 +645,7 @@ class WeAllExecutor:
                 "ts": _now(),
                 "prev_block_id": self._prev_block_id(),
             }
-            self.save_state()
+            self.mark_dirty()
             return {"ok": True, "proposal_id": proposal_id, "count": len(txs)}
 
     def vote_finalize(self, proposal_id: str, voter: Optional[str] = None) -> dict:
@@ -672,6 +737,13 @@ class WeAllExecutor:
         tx_ids: List[str] = []
         receipt_hashes: List[str] = []
 
+        # Hoisted out of the per-tx loop (the ledger dict is not rebound
+        # while a block applies).
+        ledger = self.ledger
+        nonce_store = self.nonce_store
+        tx_receipts = ledger.setdefault("tx_receipts", {})
+        tx_receipt_hashes = ledger.setdefault("tx_receipt_hashes", {})
+
         for i, item in enumerate(txs):
             b64 = str(item.get("b64", "")) if isinstance(item, dict) else ""
             hinted_tx_id = str(item.get("tx_id", "")) if isinstance(item, dict) else ""
@@ -692,15 +764,15 @@ class WeAllExecutor:
                 continue
 
             try:
-                ok, r = apply_proto_tx_atomic(self.ledger, env, self.nonce_store)
+                ok, r = apply_proto_tx_atomic(ledger, env, nonce_store)
 
                 rid = _bhex(getattr(env, "tx_id", b"") or b"") or hinted_tx_id
                 receipts.append({"ok": bool(ok), "receipt": r, "pos": i, "tx_id": rid})
 
                 if rid:
-                    self.ledger.setdefault("tx_receipts", {})[rid] = r
+                    tx_receipts[rid] = r
                     rh = receipt_hash(r)
-                    self.ledger.setdefault("tx_receipt_hashes", {})[rid] = rh
+                    tx_receipt_hashes[rid] = rh
                     tx_ids.append(rid)
                     receipt_hashes.append(rh)
 
@@ -738,9 +810,12 @@ class WeAllExecutor:
     # ----------------------- status ------------------
 
     def status(self) -> dict:
+        # One height / validator lookup shared by every field below.
+        h = self.chain_height()
+        vals = self._active_validators_for_height(h)
         return {
             "ok": True,
-            "height": self.chain_height(),
+            "height": h,
             "epoch": 0,
             "bootstrap_mode": bool(self.ledger.get("bootstrap_mode", False)),
             "driver": {
@@ -750,15 +825,15 @@ class WeAllExecutor:
                 "block_interval_sec": int(os.environ.get("WEALL_BLOCK_INTERVAL_SECONDS", "10")),
                 "node_id": self.node_id,
                 "is_validator_node": self.can_participate_in_consensus(),
-                "validators": self._active_validators_for_height(self.chain_height()),
-                "chain_height": self.chain_height(),
+                "validators": list(vals),
+                "chain_height": h,
                 "chain_id": self.chain_id,
                 "schema_version": self.schema_version,
                 "strict_prod": self.strict_prod,
                 "dev_allow_unsigned": self.dev_allow_unsigned,
                 "genesis_single_verifier": self.genesis_single_verifier,
                 "kofn_start_height": self.kofn_start_height,
-                "next_proposer": self.proposer_for_next_height(),
+                "next_proposer": self._proposer_at(h, vals),
                 "mempool_size": self.mempool_size(),
             },
         }
@@ -782,6 +857,7 @@ class WeAllExecutor:
                 t.join(timeout=2.0)
             except Exception:
                 pass
+        self.flush()
 
     def _loop_main(self) -> None:
         interval = float(os.environ.get("WEALL_BLOCK_INTERVAL_SECONDS", "10") or 10.0)
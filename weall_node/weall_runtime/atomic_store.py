@@ -8,17 +8,30 @@ Adds:
 - Rolling backups (.bak1, .bak2, ...) to survive partial writes/corruption
 - Load fallback: primary -> bak1 -> bak2 -> ...
 - Optional write-ahead journal (.journal) so we can detect incomplete saves
+- One write + one fsync per save (the journal marker is not fsynced)
+- Saves whose bytes match the last committed snapshot are skipped, so idle
+  re-saves neither cost IO nor rotate real history out of the backups
+- Snapshots are always encoded with stdlib json (it keeps NaN/Infinity,
+  which orjson would turn into null); orjson only speeds up decoding when
+  installed (constraints.txt keeps it out of Termux installs)
 
 This remains JSON snapshot storage (not log-structured), but the backup +
 journal behavior gives you "crash survivability" similar to a lightweight WAL.
 """
 
+import hashlib
 import json
+import mmap
 import os
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional speedup, not installed on Termux
+    orjson = None  # type: ignore
 
 
 JsonDict = Dict[str, Any]
@@ -45,6 +58,18 @@ def _json_dumps(obj: JsonDict) -> bytes:
     return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
 
+def _json_loads(raw: Union[bytes, memoryview]) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens json.dumps writes for
+            # non-finite floats; let the stdlib parser read those.
+            pass
+    # json.loads detects UTF-8 on bytes itself; no explicit .decode() pass.
+    return json.loads(bytes(raw) if isinstance(raw, memoryview) else raw)
+
+
 def atomic_write_bytes(path: Path, data: bytes) -> None:
     _ensure_dir(path.parent)
 
@@ -67,11 +92,20 @@ def atomic_write_bytes(path: Path, data: bytes) -> None:
 
 
 def read_json(path: Path) -> Optional[JsonDict]:
-    if not path.exists():
+    # Single open() instead of exists()+open(): fewer syscalls and no race.
+    try:
+        f = open(path, "rb")
+    except OSError:
         return None
     try:
-        raw = path.read_bytes()
-        return json.loads(raw.decode("utf-8"))
+        with f:
+            if orjson is not None and os.fstat(f.fileno()).st_size > 0:
+                # orjson parses straight from the page cache: no bytes copy
+                # of the snapshot and no intermediate str.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return _json_loads(view)
+            return _json_loads(f.read())
     except Exception:
         return None
 
@@ -119,6 +153,10 @@ class AtomicLedgerStore:
         self.data_dir = Path(chosen)
         self.filename = filename
         self.keep_backups = int(keep_backups)
+        # Digest of the last snapshot this store committed (None = unknown),
+        # and the (st_size, st_mtime_ns) the primary had right after it.
+        self._last_digest: Optional[bytes] = None
+        self._last_stat: Optional[Tuple[int, int]] = None
 
     @property
     def path(self) -> Path:
@@ -156,9 +194,16 @@ class AtomicLedgerStore:
 
         data = _json_dumps(state)
 
-        # Write a journal marker first (best-effort).
+        digest = hashlib.blake2b(data, digest_size=32).digest()
+        if digest == self._last_digest and self._primary_stat() == self._last_stat:
+            # Same bytes, and the primary is still the file we wrote.
+            return
+
+        # Write a journal marker first (best-effort). The marker is only a
+        # hint for crash forensics, so it does not get its own fsync; the
+        # primary write below is the single durable sync point per save.
         try:
-            atomic_write_bytes(self.journal_path, b"1")
+            self.journal_path.write_bytes(b"1")
         except Exception:
             pass
 
@@ -167,6 +212,8 @@ class AtomicLedgerStore:
 
         # Write new primary atomically.
         atomic_write_bytes(self.path, data)
+        self._last_digest = digest
+        self._last_stat = self._primary_stat()
 
         # Clear journal after successful commit.
         try:
@@ -175,6 +222,13 @@ class AtomicLedgerStore:
         except Exception:
             pass
 
+    def _primary_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
+
     # Legacy aliases
     def load_snapshot(self) -> Optional[JsonDict]:
         return self.load()
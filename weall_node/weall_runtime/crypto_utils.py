@@ -82,6 +82,17 @@ def verify_signature_ed25519(
     return core_crypto.ed25519_verify(public_key_hex, bytes(message), signature_hex)
 
 
+def verify_signature_ed25519_bytes(
+    public_key: bytes, message: bytes, signature: bytes
+) -> bool:
+    """
+    Raw-bytes form of verify_signature_ed25519 (no hex encode/decode).
+    """
+    return core_crypto.ed25519_verify_bytes(
+        bytes(public_key), bytes(message), bytes(signature)
+    )
+
+
 # Some older code paths may refer to verify_ed25519_sig; keep an alias.
 def verify_ed25519_sig(
     public_key_hex: str,
@@ -30,7 +30,7 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # ---------------------------------------------------------------------------
 # Monetary policy constants
@@ -121,6 +121,22 @@ class WeCoinLedger:
 
     total_issued: float = 0.0
 
+    # (source dict, ((pool, fraction), ...)) memo for the per-block reward
+    # loop; rebuilt whenever pool_split is replaced (set_pool_split or plain
+    # assignment). In-place edits of pool_split should go via set_pool_split.
+    _split_items_memo: Optional[Tuple[Dict[str, float], Tuple[Tuple[str, float], ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Per-halving-era reward table: (halving_count, initial_block_reward,
+    # base_reward) and (base_reward, split items, per-pool amounts). Both
+    # are constant for ~100k blocks, so the block path is a tuple compare.
+    _halving_memo: Optional[Tuple[int, float, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _pool_amounts_memo: Optional[
+        Tuple[float, Tuple[Tuple[str, float], ...], Tuple[Tuple[str, float], ...]]
+    ] = field(default=None, init=False, repr=False, compare=False)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -139,11 +155,31 @@ class WeCoinLedger:
         20/20/20/20/20 split. Values are normalized to sum to 1.0.
         """
         self.pool_split = _normalize_pool_split(new_split)
+        self._split_items_memo = None
 
         # Ensure pools/tickets dictionaries have entries for all pools
         for name in self.pool_split.keys():
             self._ensure_pool(name)
 
+    def _pool_split_items(self) -> Tuple[Tuple[str, float], ...]:
+        """pool_split as a tuple of (pool, float fraction), in split order."""
+        memo = self._split_items_memo
+        if memo is None or memo[0] is not self.pool_split:
+            items = tuple((str(k), float(v)) for k, v in self.pool_split.items())
+            memo = (self.pool_split, items)
+            self._split_items_memo = memo
+        return memo[1]
+
+    def _pool_amounts(self, base_reward: float) -> Tuple[Tuple[str, float], ...]:
+        """(pool, base_reward * fraction) per pool, reused while neither changes."""
+        items = self._pool_split_items()
+        memo = self._pool_amounts_memo
+        if memo is None or memo[0] != base_reward or memo[1] is not items:
+            amounts = tuple((pool, base_reward * fraction) for pool, fraction in items)
+            memo = (base_reward, items, amounts)
+            self._pool_amounts_memo = memo
+        return memo[2]
+
     # ------------------------------------------------------------------
     # Ticket management
     # ------------------------------------------------------------------
@@ -160,6 +196,23 @@ class WeCoinLedger:
         self._ensure_pool(pool)
         self.pools[pool]["members"].add(account_id)
 
+    def remove_member(self, pool: str, account_id: str) -> None:
+        """Drop an account from a rewards pool's membership set (no-op if absent)."""
+        members = self.pools.get(pool, {}).get("members")
+        if members:
+            members.discard(account_id)
+
+    def pool_members(self, pool: str) -> Tuple[str, ...]:
+        """
+        Read-only, deterministically ordered snapshot of a pool's members.
+
+        Built fresh on each call, so direct edits of pools[pool]["members"]
+        are always reflected. Unknown pools return () without creating an
+        entry.
+        """
+        members = self.pools.get(pool, {}).get("members") or ()
+        return tuple(sorted(members))
+
     def add_ticket(self, pool: str, account_id: str, weight: float) -> None:
         """
         Add a weighted ticket for an account in a given pool for the current lottery.
@@ -205,7 +258,12 @@ class WeCoinLedger:
             block_height = 0
 
         halving_count = block_height // blocks_per_halving
-        base_reward = self.initial_block_reward / float(2**halving_count)
+        memo = self._halving_memo
+        if memo is not None and memo[0] == halving_count and memo[1] == self.initial_block_reward:
+            base_reward = memo[2]
+        else:
+            base_reward = self.initial_block_reward / float(2**halving_count)
+            self._halving_memo = (halving_count, self.initial_block_reward, base_reward)
 
         # No negative/zero rewards.
         if base_reward <= 0:
@@ -286,6 +344,25 @@ class WeCoinLedger:
             # Treasury is not in any pool by default
             return
 
+    def bulk_credit(self, credits: Iterable[Tuple[str, float]]) -> float:
+        """
+        Apply many credits in one pass and return the total credited.
+
+        Credits are applied one by one in the given order, so balances are
+        bit-for-bit what the same sequence of _credit() calls would give.
+        Same filtering as _credit(): empty account ids and non-positive
+        amounts are skipped.
+        """
+        balances = self.balances
+        bget = balances.get
+        total = 0.0
+        for account_id, amount in credits:
+            if account_id and amount > 0.0:
+                amount = float(amount)
+                balances[account_id] = bget(account_id, 0.0) + amount
+                total += amount
+        return total
+
     def get_balance(self, account_id: str) -> float:
         return float(self.balances.get(account_id, 0.0))
 
@@ -358,13 +435,15 @@ class WeCoinLedger:
                 winners[pool] = None
             return winners
 
-        # Per-pool rewards (shares add up to base_reward by construction)
-        for pool, fraction in self.pool_split.items():
-            amount = base_reward * float(fraction)
+        # Per-pool rewards (shares add up to base_reward by construction).
+        # Payouts are collected first and applied in pool order with one
+        # bulk_credit call.
+        payouts: List[Tuple[str, float]] = []
+        for pool, amount in self._pool_amounts(base_reward):
 
             # Treasury pool is special: it always credits the treasury account
             if pool == "treasury":
-                self._credit(TREASURY_ACCOUNT, amount)
+                payouts.append((TREASURY_ACCOUNT, amount))
                 winners[pool] = TREASURY_ACCOUNT
                 continue
 
@@ -375,12 +454,14 @@ class WeCoinLedger:
 
             if not winner:
                 # No valid winner for this pool → redirect share to treasury
-                self._credit(TREASURY_ACCOUNT, amount)
+                payouts.append((TREASURY_ACCOUNT, amount))
                 winners[pool] = TREASURY_ACCOUNT
             else:
-                self._credit(winner, amount)
+                payouts.append((winner, amount))
                 winners[pool] = winner
 
+        self.bulk_credit(payouts)
+
         # Track issuance: all pool shares (including redirected ones) sum to base_reward
         self.total_issued += base_reward
 
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, Any
+from typing import Any, Dict, Iterable, Optional, Tuple
 import time
 
 MIN_REP = -1.0
@@ -56,3 +56,35 @@ class ReputationRuntime:
             }
         )
         return new_score
+
+    def apply_deltas(
+        self, deltas: Iterable[Tuple[str, float, Optional[str]]]
+    ) -> Dict[str, float]:
+        """
+        Apply many (user_id, delta, reason) updates in one pass.
+
+        Equivalent to calling apply_delta for each item in order (clamping
+        after every step), but resolves the state containers and timestamp
+        once. Returns the final score per touched user.
+        """
+        scores = self.state["reputation"]
+        events = self.state["rep_events"]
+        ts = int(time.time())
+        out: Dict[str, float] = {}
+        for user_id, delta, reason in deltas:
+            if not user_id:
+                raise ValueError("user_id is required")
+            d = float(delta)
+            new_score = self._clamp(float(scores.get(user_id, 0.0)) + d)
+            scores[user_id] = new_score
+            events.append(
+                {
+                    "user": user_id,
+                    "delta": d,
+                    "result": new_score,
+                    "reason": (reason or "unspecified"),
+                    "ts": ts,
+                }
+            )
+            out[user_id] = new_score
+        return out
@@ -16,6 +16,7 @@ Also preserves runtime compatibility:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
 from typing import Dict, FrozenSet, List, Optional, Set
 
@@ -194,13 +195,21 @@ _BASE_CAPS: Dict[PoHTier, FrozenSet[Capability]] = {
 }
 
 
+_DEFAULT_FLAGS = HumanRoleFlags()
+
+
 def compute_effective_role_profile(
     poh_tier: PoHTier | int,
     flags: Optional[HumanRoleFlags] = None,
     node_kind: NodeKind = NodeKind.FULL,
 ) -> RoleProfile:
-    tier = PoHTier(int(poh_tier))
-    f = flags or HumanRoleFlags()
+    # Inputs are a tier (4 values), a frozen flags dataclass and an enum, so
+    # the profile space is tiny; gated endpoints hit the memo every time.
+    return _role_profile(PoHTier(int(poh_tier)), flags or _DEFAULT_FLAGS, node_kind)
+
+
+@lru_cache(maxsize=512)
+def _role_profile(tier: PoHTier, f: HumanRoleFlags, node_kind: NodeKind) -> RoleProfile:
 
     caps: Set[Capability] = set(_BASE_CAPS[tier])
 